@@ -0,0 +1,21 @@
+"""Optionele Numba-ondersteuning.
+
+Importeer `njit` altijd via deze module. Als numba niet geïnstalleerd is,
+is `njit` een no-op decorator en draait de kernel als gewone Python;
+`NUMBA_AVAILABLE` laat aanroepers een snellere NumPy-variant kiezen.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - afhankelijk van de omgeving
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op vervanger voor numba.njit (met of zonder argumenten)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def _decorator(fn):
+            return fn
+        return _decorator
@@ -6,12 +6,23 @@ Streamlit UI can read on every rerun.
 """
 
 import datetime
+import functools
 import json
+import logging
 import os
+import queue
 import threading
 import time
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optioneel; stdlib json als fallback
+    orjson = None
+
 from data.mock_saxo import MockSaxoFeed
 from data.yfinance_feed import YFinanceFeed
 from strategies.asml_setups import (
@@ -20,13 +31,34 @@ from strategies.asml_setups import (
     OpeningRangeBreak,
     ClosingReversion,
 )
+from strategies import _kernels as strategy_kernels
 from strategy.breakout import BreakoutStrategy
 from turbo.translate import TurboTranslator
 
 
+_log = logging.getLogger(__name__)
+
 _CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "candle_cache.json")
-_SAVE_INTERVAL_MOCK = 20   # elke 20 candles opslaan in mock-modus (= ~2 sec)
-_SAVE_INTERVAL_LIVE = 1    # elke candle opslaan in live-modus (= ~1 min interval)
+
+
+def _json_dumps(obj):
+    """Serialiseer naar UTF-8 bytes (orjson als beschikbaar, accepteert ook numpy-scalars)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse JSON-bytes; geeft ValueError bij ongeldige inhoud (beide backends)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_SAVE_INTERVAL_S = 2.0     # cache hooguit elke 2 sec opslaan (live: elke nieuwe candle)
+_PUBLISH_INTERVAL_MOCK = 5  # elke 5 candles een nieuwe state-snapshot in mock-modus
+_PUBLISH_INTERVAL_LIVE = 1  # elke candle publiceren in live-modus
+_MOCK_BATCH = 1024          # candles per batch in batch-modus (config: mock_batch)
 
 
 def _save_cache(path, ticker, feed_mode, candle_history, signals, candle_count):
@@ -40,8 +72,8 @@ def _save_cache(path, ticker, feed_mode, candle_history, signals, candle_count):
             "candle_history": candle_history,
             "signals":       signals,
         }
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh)
+        with open(path, "wb") as fh:
+            fh.write(_json_dumps(payload))
     except OSError:
         pass
 
@@ -53,9 +85,9 @@ def _load_cache(path, ticker):
     feed_mode wordt meegeladen zodat de UI de juiste radio-default toont.
     """
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (OSError, json.JSONDecodeError, ValueError):
+        with open(path, "rb") as fh:
+            data = _json_loads(fh.read())
+    except (OSError, ValueError):
         return None
     if (data.get("date") == datetime.date.today().isoformat()
             and data.get("ticker") == ticker
@@ -69,19 +101,56 @@ def _load_cache(path, ticker):
     return None
 
 
-def _load_config(path="config.yaml"):
-    import os
+# setup_name -> (strategieklasse, heeft prev_close nodig). Onbekende namen
+# vallen terug op BreakoutStrategy.
+STRATEGY_TABLE = {
+    "morning_gap":         (MorningGapFill, True),
+    "morning_momentum":    (MorningMomentum, False),
+    "opening_range_break": (OpeningRangeBreak, False),
+    "closing_reversion":   (ClosingReversion, False),
+}
+
+# demo_force_window: tijdvensters open voor demo-/mock-data. ORB kent alleen
+# force_window, de andere setups alleen start/end.
+_FORCE_WINDOW = {"start": "00:00", "end": "23:59", "force_window": True}
+
+
+# C-versnelde YAML-parser als libyaml beschikbaar is
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path, mtime_ns):
+    """Parse config-YAML; gecached per (pad, mtime). Resultaat niet muteren."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _resolve_config_path(path="config.yaml"):
     if not os.path.exists(path):
         # Fallback voor Streamlit Community Cloud (geen config.yaml in repo)
-        fallback = os.path.join(os.path.dirname(path) or ".", "config.example.yaml")
-        path = fallback
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        path = os.path.join(os.path.dirname(path) or ".", "config.example.yaml")
+    return path
 
 
 class TradingEngine:
     """Runs a trading loop in a daemon thread and exposes shared state.
 
+    The loop thread is the only writer of the state attributes. It
+    publishes an immutable snapshot by reassigning `_state_snapshot`
+    (atomic in CPython), so `get_state()` never takes a lock. `_lock`
+    only guards the start()/stop() lifecycle transitions.
+
+    One long-lived worker thread runs the loop. start() only stops the
+    current run (via its stop event) and queues a job with the new
+    parameters; the worker applies them and resets the state itself, so
+    a restart never waits on the old run and never spawns a thread.
+
+    get_state() hands out the snapshot itself, without copying. Contract:
+    the writer never mutates a published object (signals/candles are
+    tuples, candle and signal dicts are not touched again after they are
+    appended), and readers treat the state as read-only.
+
     Usage:
         engine = TradingEngine()
         engine.start(setup_name="morning_gap", prev_close=1210.0, leverage=3.5, ratio=10)
@@ -92,14 +161,19 @@ class TradingEngine:
         engine.stop()
     """
 
-    MAX_SIGNALS = 50  # keep only the most recent signals
+    MAX_SIGNALS = 50     # keep only the most recent signals
+    CHART_CANDLES = 100  # candles kept for the chart
 
     def __init__(self, config_path="config.yaml"):
         self._lock = threading.Lock()
         self._running = False
-        self._thread = None
+        self._stop_event = threading.Event()   # stop-event van de lopende/laatste run
+        self._jobs = queue.Queue()
 
-        self.cfg = _load_config(config_path)
+        self._config_path = config_path
+        self._cfg_key = None                 # (pad, mtime_ns) van de geladen config
+        self.cfg = {}
+        self._maybe_reload_config()
 
         # Defaults from config — overrideable via start()
         turbo_cfg = self.cfg.get("turbo", {})
@@ -110,12 +184,13 @@ class TradingEngine:
         self.ticker = self.cfg.get("underlying_symbol", "ASML.AS")
         self.feed_mode = "mock"   # "mock" of "live"
 
-        # Shared state (always access via get_state() or inside _lock)
+        # Writer-state (alleen de loop-thread schrijft; lezen via get_state())
         self.current_price: float | None = None
         self.current_candle: dict | None = None
-        self.signals: list = []
-        self.candle_history: list = []   # last 100 candles for chart
+        self.signals = deque(maxlen=self.MAX_SIGNALS)
+        self.candle_history = deque(maxlen=self.CHART_CANDLES)   # chart-history
         self.candle_count: int = 0
+        self.run_id: int = 0               # telt de runs; nieuwe reeks per start()
         self.status: str = "stopped"
         self.error_msg: str | None = None
 
@@ -123,11 +198,16 @@ class TradingEngine:
         cached = _load_cache(_CACHE_FILE, self.ticker)
         if cached:
             ch, sigs, cnt, fm = cached
-            self.candle_history = ch
-            self.signals       = sigs
+            self.candle_history = deque(ch, maxlen=self.CHART_CANDLES)
+            self.signals       = deque(sigs, maxlen=self.MAX_SIGNALS)
             self.candle_count  = cnt
             self.feed_mode     = fm          # herstel ook feed-modus
             self.current_price = float(ch[-1]["close"])
+        self._publish()
+
+        self._worker = threading.Thread(target=self._worker_main,
+                                        name="trading-engine", daemon=True)
+        self._worker.start()
 
     # ------------------------------------------------------------------
     # Public API
@@ -135,191 +215,283 @@ class TradingEngine:
 
     def start(self, setup_name=None, prev_close=None, leverage=None, ratio=None,
               ticker=None, feed_mode=None):
-        """(Re)start the trading loop with optional new parameters."""
-        # Stop and wait for any running thread first
-        if self._thread and self._thread.is_alive():
-            self._running = False
-            self._thread.join(timeout=3.0)
+        """(Re)start the trading loop with optional new parameters.
 
-        # Apply new parameters
+        Returns immediately; the worker picks the job up as soon as the
+        previous run has seen its stop event.
+        """
+        params = {}
         if setup_name is not None:
-            self.setup_name = setup_name
+            params["setup_name"] = setup_name
         if prev_close is not None:
-            self.prev_close = float(prev_close)
+            params["prev_close"] = float(prev_close)
         if leverage is not None:
-            self.leverage = float(leverage)
+            params["leverage"] = float(leverage)
         if ratio is not None:
-            self.ratio = float(ratio)
+            params["ratio"] = float(ratio)
         if ticker is not None:
-            self.ticker = ticker
+            params["ticker"] = ticker
         if feed_mode is not None:
-            self.feed_mode = feed_mode
+            params["feed_mode"] = feed_mode
+
+        # Config opnieuw inlezen als de YAML intussen is aangepast
+        self._maybe_reload_config()
 
-        # Reset state + invalideer cache zodat een directe refresh geen
-        # verouderde data toont
-        _save_cache(_CACHE_FILE, self.ticker, self.feed_mode, [], [], 0)
         with self._lock:
-            self.signals = []
-            self.candle_history = []
-            self.candle_count = 0
-            self.current_price = None
-            self.current_candle = None
-            self.error_msg = None
-            self.status = "starting"
+            self._stop_event.set()               # stop de lopende run
+            self._stop_event = threading.Event()
             self._running = True
-
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._thread.start()
+            self._jobs.put((params, self._stop_event))
 
     def stop(self):
-        """Signal the trading loop to stop."""
-        self._running = False
+        """Signal the trading loop to stop.
+
+        Only sets the stop event; the loop thread publishes the final
+        "stopped" snapshot once it has exited.
+        """
         with self._lock:
-            self.status = "stopped"
+            self._running = False
+            self._stop_event.set()
 
     def is_running(self) -> bool:
         return self._running
 
-    def get_state(self) -> dict:
-        """Return a snapshot of the shared state (thread-safe)."""
-        with self._lock:
-            return {
-                "current_price": self.current_price,
-                "current_candle": dict(self.current_candle) if self.current_candle else None,
-                "signals": list(self.signals),
-                "candle_history": list(self.candle_history),
-                "candle_count": self.candle_count,
-                "status": self.status,
-                "error_msg": self.error_msg,
-                "setup_name": self.setup_name,
-                "prev_close": self.prev_close,
-                "leverage": self.leverage,
-                "ratio": self.ratio,
-                "ticker": self.ticker,
-                "feed_mode": self.feed_mode,
-            }
+    def get_state(self) -> Mapping:
+        """Return the latest published state snapshot (lock-free, read-only)."""
+        return self._state_snapshot
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _maybe_reload_config(self):
+        """Herlaad de config alleen als pad of mtime veranderd is (één stat)."""
+        path = _resolve_config_path(self._config_path)
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            if self._cfg_key is not None:
+                return                       # bestand tijdelijk weg: oude config houden
+            raise
+        if key != self._cfg_key:
+            self.cfg = _load_config_cached(*key)
+            self._cfg_key = key
+
+    def _publish(self):
+        """Publiceer de huidige writer-state als onveranderlijke snapshot."""
+        self._state_snapshot = MappingProxyType({
+            "current_price": self.current_price,
+            "current_candle": self.current_candle,
+            "signals": tuple(self.signals),
+            "candle_history": tuple(self.candle_history),
+            "candle_count": self.candle_count,
+            "run_id": self.run_id,
+            "status": self.status,
+            "error_msg": self.error_msg,
+            "setup_name": self.setup_name,
+            "prev_close": self.prev_close,
+            "leverage": self.leverage,
+            "ratio": self.ratio,
+            "ticker": self.ticker,
+            "feed_mode": self.feed_mode,
+        })
+
     def _build_strategy(self):
         cfg = self.cfg
-        force = cfg.get("demo_force_window", True)
         setups = cfg.get("setups", {})
 
-        if self.setup_name == "morning_gap":
-            s_cfg = setups.get("morning_gap", {}).copy()
-            if force:
-                s_cfg["start"] = "00:00"
-                s_cfg["end"] = "23:59"
-            strategy = MorningGapFill(s_cfg)
+        entry = STRATEGY_TABLE.get(self.setup_name)
+        if entry is None:
+            return BreakoutStrategy(setups.get("breakout", {}))
+
+        cls, needs_prev_close = entry
+        s_cfg = dict(setups.get(self.setup_name, {}))
+        if cfg.get("demo_force_window", True):
+            s_cfg.update(_FORCE_WINDOW)
+        strategy = cls(s_cfg)
+        if needs_prev_close:
             strategy.set_prev_close(self.prev_close)
-            return strategy
-
-        if self.setup_name == "morning_momentum":
-            s_cfg = setups.get("morning_momentum", {}).copy()
-            if force:
-                s_cfg["start"] = "00:00"
-                s_cfg["end"] = "23:59"
-            return MorningMomentum(s_cfg)
-
-        if self.setup_name == "opening_range_break":
-            s_cfg = setups.get("opening_range_break", {}).copy()
-            if force:
-                s_cfg["force_window"] = True
-            return OpeningRangeBreak(s_cfg)
-
-        if self.setup_name == "closing_reversion":
-            s_cfg = setups.get("closing_reversion", {}).copy()
-            if force:
-                s_cfg["start"] = "00:00"
-                s_cfg["end"] = "23:59"
-            return ClosingReversion(s_cfg)
-
-        return BreakoutStrategy(setups.get("breakout", {}))
-
-    def _run_loop(self):
+        return strategy
+
+    def _add_signal(self, signal, turbo):
+        """Verrijk een signaal met turbo-waarden en voeg het toe aan de lijst."""
+        asml_price = float(signal["entry"])
+        # financing vult de gebruiker in de calculator in; translate() geeft
+        # dan alleen de isin's + een error-key terug
+        turbo_vals = turbo.translate(
+            signal,
+            asml_price=asml_price,
+            ratio=self.ratio,
+        )
+        signal["turbo"] = turbo_vals
+        self.signals.append(signal)
+
+    def _worker_main(self):
+        """Worker-thread: voert jobs uit start() één voor één uit."""
+        # JIT-kernels vooraf compileren/laden, zodat de eerste candle niet wacht
+        strategy_kernels.warmup()
+        while True:
+            job = self._jobs.get()
+            # Snel opeenvolgende start()-calls: alleen de laatste job telt
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+            params, stop_event = job
+            if stop_event.is_set():              # al gestopt vóór de start
+                continue
+            try:
+                self._run_loop(params, stop_event)
+            except Exception as exc:
+                # fout buiten de consume-loop (cache, feed, strategie, turbo):
+                # alleen deze run faalt, de worker blijft jobs aannemen
+                self.status = "error"
+                self.error_msg = str(exc)
+                self._publish()
+
+    def _run_loop(self, params, stop_event):
+        # Nieuwe parameters toepassen (pas hier, zodat de vorige run tot het
+        # eind met zijn eigen ticker/feed_mode cachet)
+        for name, value in params.items():
+            setattr(self, name, value)
+
+        # Reset state + invalideer cache zodat een directe refresh geen
+        # verouderde data toont
+        _save_cache(_CACHE_FILE, self.ticker, self.feed_mode, [], [], 0)
+        with self._lock:
+            self.signals = deque(maxlen=self.MAX_SIGNALS)
+            self.candle_history = deque(maxlen=self.CHART_CANDLES)
+            self.candle_count = 0
+            self.run_id += 1
+            self.current_price = None
+            self.current_candle = None
+            self.error_msg = None
+            self.status = "starting"
+            self._publish()
+
         cfg = self.cfg
+        # Batch-modus: mock-feed levert kolommen, strategie verwerkt ze gevectoriseerd
+        batch_mode = self.feed_mode != "live" and bool(cfg.get("mock_batch", False))
 
         if self.feed_mode == "live":
-            feed = YFinanceFeed(ticker=self.ticker)
+            feed = YFinanceFeed(ticker=self.ticker, stop_event=stop_event)
         else:
             # Demo: random-walk feed vanaf ~1% onder prev_close
             start_price = round(self.prev_close * 0.99, 2)
-            feed = MockSaxoFeed(symbol=self.ticker, start_price=start_price)
+            feed = MockSaxoFeed(symbol=self.ticker, start_price=start_price,
+                                batch=_MOCK_BATCH if batch_mode else 4096)
 
         strategy = self._build_strategy()
+        if batch_mode and not hasattr(strategy, "process_batch"):
+            # alleen morning_gap en de generieke breakout hebben een batch-pad
+            _log.warning("mock_batch: setup %r heeft geen process_batch, "
+                         "candles gaan één voor één door on_candle", self.setup_name)
+            batch_mode = False
 
         turbo_cfg = cfg.get("turbo", {}).copy()
         turbo_cfg["leverage"] = self.leverage
         turbo = TurboTranslator(turbo_cfg)
 
-        with self._lock:
-            self.status = "running"
-
-        _buf: list = []
-        CHART_CANDLES = 100
-        _save_interval = _SAVE_INTERVAL_LIVE if self.feed_mode == "live" else _SAVE_INTERVAL_MOCK
+        _buf = deque(maxlen=self.CHART_CANDLES)
+        self.candle_history = _buf
+        self._last_save = time.monotonic()
+        self.status = "running"
+        self._publish()
 
         try:
-            for candle in feed.stream_candles():
-                if not self._running:
-                    break
-
-                _buf.append(candle)
-                if len(_buf) > CHART_CANDLES:
-                    _buf = _buf[-CHART_CANDLES:]
-
-                with self._lock:
-                    self.current_price = float(candle["close"])
-                    self.current_candle = candle
-                    self.candle_count += 1
-                    self.candle_history = list(_buf)
-
-                signal = strategy.on_candle(candle)
-                if signal:
-                    asml_price = float(signal["entry"])
-                    turbo_vals = turbo.translate(
-                        signal,
-                        asml_price=asml_price,
-                        turbo_price=None,   # user supplies this in the calculator
-                        ratio=self.ratio,
-                    )
-                    signal["turbo"] = turbo_vals
-
-                    with self._lock:
-                        self.signals.append(signal)
-                        if len(self.signals) > self.MAX_SIGNALS:
-                            self.signals = self.signals[-self.MAX_SIGNALS:]
-
-                # Periodiek opslaan naar cache
-                if self.candle_count % _save_interval == 0:
-                    with self._lock:
-                        _snap_h = list(self.candle_history)
-                        _snap_s = list(self.signals)
-                        _snap_c = self.candle_count
-                    _save_cache(_CACHE_FILE, self.ticker, self.feed_mode,
-                                _snap_h, _snap_s, _snap_c)
-
-                if self.feed_mode == "mock":
-                    time.sleep(0.1)  # 100 ms per candle in demo mode
+            if batch_mode:
+                self._consume_batches(feed, strategy, turbo, _buf, stop_event)
+            else:
+                self._consume_candles(feed, strategy, turbo, _buf, stop_event)
 
         except Exception as exc:
-            with self._lock:
-                self.status = "error"
-                self.error_msg = str(exc)
+            self.status = "error"
+            self.error_msg = str(exc)
             return
 
         finally:
             # Altijd een finale save bij stoppen (normaal of via Stop-knop)
-            with self._lock:
-                _snap_h = list(self.candle_history)
-                _snap_s = list(self.signals)
-                _snap_c = self.candle_count
             _save_cache(_CACHE_FILE, self.ticker, self.feed_mode,
-                        _snap_h, _snap_s, _snap_c)
+                        list(self.candle_history), list(self.signals),
+                        self.candle_count)
+            self._publish()
 
-        with self._lock:
-            if self.status != "error":
-                self.status = "stopped"
+        if self.status != "error":
+            self.status = "stopped"
+        self._publish()
+
+    def _maybe_save(self):
+        """Schrijf de cache naar schijf, hooguit elke _SAVE_INTERVAL_S seconden."""
+        now = time.monotonic()
+        if now - self._last_save < _SAVE_INTERVAL_S:
+            return
+        self._last_save = now
+        _save_cache(_CACHE_FILE, self.ticker, self.feed_mode,
+                    list(self.candle_history), list(self.signals),
+                    self.candle_count)
+
+    def _consume_candles(self, feed, strategy, turbo, _buf, stop_event):
+        """Scalar pad: één candle per keer door strategy.on_candle()."""
+        _publish_interval = _PUBLISH_INTERVAL_LIVE if self.feed_mode == "live" else _PUBLISH_INTERVAL_MOCK
+
+        pacing = 0.0
+        if self.feed_mode == "mock":
+            pacing = float(self.cfg.get("mock_pacing_ms") or 0) / 1000
+
+        for candle in feed.stream_candles():
+            if stop_event.is_set():
+                break
+
+            _buf.append(candle)
+            self.current_price = float(candle["close"])
+            self.current_candle = candle
+            self.candle_count += 1
+            publish = self.candle_count % _publish_interval == 0
+
+            signal = strategy.on_candle(candle)
+            if signal:
+                self._add_signal(signal, turbo)
+                publish = True
+
+            if publish:
+                self._publish()
+
+            self._maybe_save()
+
+            # Optionele pacing voor de demo; de UI leest zelf via get_state()
+            if pacing:
+                time.sleep(pacing)
+
+    def _consume_batches(self, feed, strategy, turbo, _buf, stop_event):
+        """Batch pad: kolommen van _MOCK_BATCH candles door strategy.process_batch().
+
+        Alleen de laatste CHART_CANDLES candles van een batch worden als dict
+        opgebouwd (voor de chart); na elke batch volgt een publish.
+        """
+        for cols in feed.stream_batches():
+            if stop_event.is_set():
+                break
+
+            for sig in strategy.process_batch(cols["open"], cols["high"], cols["low"],
+                                              cols["close"], cols["volume"], cols["time"],
+                                              symbol=self.ticker):
+                self._add_signal(sig, turbo)
+
+            n = len(cols["close"])
+            for i in range(max(0, n - self.CHART_CANDLES), n):
+                _buf.append({
+                    "symbol": self.ticker,
+                    "time":   cols["time"][i],
+                    "_ts_ns": cols["ts_ns"][i],
+                    "open":   cols["open"][i],
+                    "high":   cols["high"][i],
+                    "low":    cols["low"][i],
+                    "close":  cols["close"][i],
+                    "volume": cols["volume"][i],
+                })
+            self.current_candle = _buf[-1]
+            self.current_price = float(self.current_candle["close"])
+            self.candle_count += n
+            self._publish()
+            self._maybe_save()
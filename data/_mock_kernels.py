@@ -0,0 +1,67 @@
+"""Numerieke kernels voor MockSaxoFeed.
+
+simulate(start_price, n, seed) genereert n random-walk candles als vijf
+kolom-arrays (open, high, low, close, volume). Volgorde van voorkeur:
+
+1. de AOT-gebouwde extensie data/mock_kernels (zie _mock_kernels_aot.py),
+   geen JIT-warmup;
+2. met numba de @njit scalar-loop (cache=True schrijft de JIT naar
+   __pycache__);
+3. zonder numba een gevectoriseerde NumPy-variant.
+"""
+
+import numpy as np
+
+from _njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _simulate_njit(start_price, n, seed):
+    np.random.seed(seed)
+    o = np.empty(n, dtype=np.float64)
+    h = np.empty(n, dtype=np.float64)
+    l = np.empty(n, dtype=np.float64)
+    c = np.empty(n, dtype=np.float64)
+    v = np.empty(n, dtype=np.int64)
+    prev = start_price
+    for i in range(n):
+        close = max(0.1, prev + np.random.uniform(-0.8, 0.8))
+        o[i] = prev
+        c[i] = close
+        h[i] = max(prev, close) + np.random.uniform(0.0, 0.5)
+        l[i] = min(prev, close) - np.random.uniform(0.0, 0.5)
+        v[i] = np.random.randint(100, 2001)
+        prev = close
+    return o, h, l, c, v
+
+
+def _simulate_numpy(start_price, n, seed):
+    rng = np.random.default_rng(seed)
+    drift = rng.uniform(-0.8, 0.8, n)
+    pad_high = rng.uniform(0.0, 0.5, n)
+    pad_low = rng.uniform(0.0, 0.5, n)
+    v = rng.integers(100, 2000, n, endpoint=True)
+    c = np.maximum(0.1, start_price + drift.cumsum())
+    o = np.concatenate(([start_price], c[:-1]))
+    h = np.maximum(o, c) + pad_high
+    l = np.minimum(o, c) - pad_low
+    return o, h, l, c, v
+
+
+try:
+    from data.mock_kernels import simulate as _simulate_aot
+except ImportError:
+    _simulate_aot = None
+
+
+def _simulate_aot_call(start_price, n, seed):
+    # AOT-signatuur is strikt (f8, i8, i8)
+    return _simulate_aot(float(start_price), int(n), int(seed))
+
+
+if _simulate_aot is not None:
+    simulate = _simulate_aot_call
+elif NUMBA_AVAILABLE:
+    simulate = _simulate_njit
+else:
+    simulate = _simulate_numpy
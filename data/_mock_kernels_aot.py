@@ -0,0 +1,31 @@
+"""AOT-build van de mock-kernels met numba.pycc.
+
+Compileert simulate() vooraf naar een extensiemodule data/mock_kernels*.so
+(.pyd op Windows), zodat de eerste candle geen JIT-warmup kost. Bouwen
+(numba nodig, vanuit de project-root):
+
+    python -m data._mock_kernels_aot
+
+data/_mock_kernels.py laadt de gebouwde module als die er is en valt
+anders terug op @njit, en zonder numba op NumPy. De kernel-code staat
+alleen in _mock_kernels.py; hier wordt alleen de signatuur vastgelegd.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from data._mock_kernels import _simulate_njit
+
+cc = CC("mock_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# simulate(start_price, n, seed) -> (open, high, low, close, volume)
+cc.export(
+    "simulate",
+    "Tuple((f8[:], f8[:], f8[:], f8[:], i8[:]))(f8, i8, i8)",
+)(_simulate_njit.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -29,10 +29,19 @@ def fetch_daily(ticker: str, period: str = "5d", exclude_today: bool = True) ->
     return _sanitize(df, exclude_today=exclude_today)
 
 
-def fetch_intraday(ticker: str, interval: str = "1m") -> pd.DataFrame | None:
-    """Download intraday OHLCV-data voor vandaag. Huidige dag wordt NIET verwijderd."""
-    df = yf.download(ticker, period="1d", interval=interval,
-                     auto_adjust=True, progress=False)
+def fetch_intraday(ticker: str, interval: str = "1m",
+                   start: datetime.datetime | None = None) -> pd.DataFrame | None:
+    """Download intraday OHLCV-data voor vandaag. Huidige dag wordt NIET verwijderd.
+
+    Met `start` wordt alleen het venster vanaf dat tijdstip opgehaald
+    (incrementele poll) in plaats van de volledige dag.
+    """
+    if start is None:
+        df = yf.download(ticker, period="1d", interval=interval,
+                         auto_adjust=True, progress=False)
+    else:
+        df = yf.download(ticker, start=start, interval=interval,
+                         auto_adjust=True, progress=False)
     return _sanitize(df, exclude_today=False)
 
 
@@ -1,38 +1,77 @@
-import random
-import datetime as dt
+import time
+
+import numpy as np
+
+from data._mock_kernels import simulate
+
+_MINUTE_NS = 60_000_000_000
 
 
 class MockSaxoFeed:
     """Generate mock 1-minute candles for an underlying symbol.
 
-    Yields dicts: {symbol, time, open, high, low, close, volume}
+    Yields dicts: {symbol, time, _ts_ns, _mod, open, high, low, close, volume}
+    (`time` is ISO-8601 UTC, `_ts_ns` the same instant as epoch-ns, `_mod`
+    its minute of day (0-1439) as int, derived from `_ts_ns` once so the
+    strategies' time windows are integer compares)
+
+    Candles are generated in batches of `batch` by `simulate()` (one column
+    per field, Numba-compiled when available) and streamed out one by one;
+    only the dict is built per yield.
     """
 
-    def __init__(self, symbol="ASML", start_price=1200.0):
+    def __init__(self, symbol="ASML", start_price=1200.0, batch=4096, seed=None):
         self.symbol = symbol
         self.price = float(start_price)
-        self.time = dt.datetime.utcnow()
+        self._next_ns = time.time_ns()  # epoch-ns of the next candle to generate
+        self.batch = max(1, int(batch))
+        self._rng = np.random.default_rng(seed)
+        self._i = 0
+        self._n = 0
+
+    def _refill(self):
+        """Pre-generate the next `batch` candles as column arrays."""
+        n = self.batch
+        seed = int(self._rng.integers(0, 2**31 - 1))
+        open_, high, low, close, volume = simulate(self.price, n, seed)
+
+        self.price = float(close[-1])
+        # round whole columns in place, then tolist() once per batch
+        # -> native floats/ints for JSON and UI
+        for col in (open_, high, low, close):
+            np.round(col, 4, out=col)
+        self._open = open_.tolist()
+        self._high = high.tolist()
+        self._low = low.tolist()
+        self._close = close.tolist()
+        self._volume = volume.tolist()
+
+        # timestamps as int64 ns; ISO strings converted for the whole batch
+        ts_ns = self._next_ns + np.arange(n, dtype=np.int64) * _MINUTE_NS
+        self._next_ns += n * _MINUTE_NS
+        self._ts_ns = ts_ns.tolist()
+        self._time = np.datetime_as_string(
+            ts_ns.astype("datetime64[ns]").astype("datetime64[s]"), timezone="UTC").tolist()
+        self._mod = ((ts_ns // _MINUTE_NS) % 1440).tolist()
+        self._i = 0
+        self._n = n
 
     def _next_candle(self):
-        # random walk for price
-        open_p = self.price
-        drift = random.uniform(-0.8, 0.8)
-        close = max(0.1, open_p + drift)
-        high = max(open_p, close) + random.uniform(0, 0.5)
-        low = min(open_p, close) - random.uniform(0, 0.5)
-        volume = random.randint(100, 2000)
+        if self._i >= self._n:
+            self._refill()
+        i = self._i
+        self._i += 1
         candle = {
             "symbol": self.symbol,
-            "time": self.time.isoformat() + "Z",
-            "open": round(open_p, 4),
-            "high": round(high, 4),
-            "low": round(low, 4),
-            "close": round(close, 4),
-            "volume": int(volume),
+            "time": self._time[i],
+            "_ts_ns": self._ts_ns[i],
+            "_mod": self._mod[i],
+            "open": self._open[i],
+            "high": self._high[i],
+            "low": self._low[i],
+            "close": self._close[i],
+            "volume": self._volume[i],
         }
-        # advance
-        self.price = close
-        self.time += dt.timedelta(minutes=1)
         return candle
 
     def stream_candles(self, limit=None):
@@ -43,3 +82,32 @@ class MockSaxoFeed:
             count += 1
             if limit and count >= limit:
                 break
+
+    def stream_batches(self, limit=None):
+        """Generator for whole batches as columns (SoA) instead of candle dicts.
+
+        Yields dicts {time, ts_ns, mod, open, high, low, close, volume} of
+        equal-length lists, `batch` candles each. `mod` is the minute of
+        day, as in the candle dicts. If limit is provided, stops after limit
+        candles.
+        """
+        count = 0
+        while True:
+            self._refill()
+            n = self._n
+            if limit:
+                n = min(n, limit - count)
+            self._i = self._n  # batch consumed; _next_candle refills
+            yield {
+                "time": self._time[:n],
+                "ts_ns": self._ts_ns[:n],
+                "mod": self._mod[:n],
+                "open": self._open[:n],
+                "high": self._high[:n],
+                "low": self._low[:n],
+                "close": self._close[:n],
+                "volume": self._volume[:n],
+            }
+            count += n
+            if limit and count >= limit:
+                break
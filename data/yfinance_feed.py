@@ -5,51 +5,94 @@ Interface identiek aan MockSaxoFeed: stream_candles() generator.
 Gedrag:
   1. Eerste aanroep: download de volledige dag (period="1d", interval="1m")
   2. Yield historische candles snel (replay van de dag tot nu)
-  3. Daarna: poll elke POLL_INTERVAL seconden voor nieuwe candles
+  3. Daarna: poll elke POLL_INTERVAL seconden alleen het recente venster
+     (vanaf de laatste tijdstempel minus POLL_OVERLAP). De download start
+     PREFETCH_LEAD seconden vóór het poll-moment op een worker-thread, zodat
+     het resultaat klaarligt wanneer de generator het nodig heeft.
   4. Yield alleen candles nieuwer dan de laatste geziene tijdstempel
 
-Tijdstempels worden omgezet van UTC → Europe/Amsterdam (CET/CEST).
+Tijdstempels worden omgezet van UTC → Europe/Amsterdam (CET/CEST) voor
+het `time`-veld (ISO, voor de UI); `_ts_ns` bevat dezelfde tijd als
+epoch-nanoseconden zodat vergelijken een integer-vergelijking is, en
+`_mod` de minuut van de dag (0-1439, wandklok CET) voor de tijdvensters.
 Buiten handelstijd geeft yfinance de laatste handelsdag terug.
 """
 
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
 import pytz
 
 from data.fetcher import fetch_intraday
 
 POLL_INTERVAL = 60  # seconden tussen live polls
+POLL_OVERLAP = pd.Timedelta(minutes=5)  # extra venster bij incrementele poll
+PREFETCH_LEAD = 5   # seconden vóór de poll dat de download al start
 CET = pytz.timezone("Europe/Amsterdam")
 
 
 class YFinanceFeed:
     """Real-data feed via yfinance voor elk geldig ticker-symbool."""
 
-    def __init__(self, ticker="ASML.AS"):
+    def __init__(self, ticker="ASML.AS", stop_event: threading.Event | None = None):
         self.ticker  = ticker
-        self._last_ts = None   # ISO-string van de laatste geleverde candle
+        # Gezet door de engine bij stop(): onderbreekt de poll-wachttijd direct
+        self._stop_event = stop_event or threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yf-prefetch")
+        self._last_ts = None   # epoch-ns (int, UTC) van de laatste geleverde candle
 
     def _fetch(self) -> list:
-        """Download 1-min candles voor vandaag. Geeft lijst van candle-dicts terug."""
-        df = fetch_intraday(self.ticker)
+        """Download 1-min candles nieuwer dan _last_ts. Geeft lijst van candle-dicts terug.
+
+        Eerste aanroep haalt de volledige dag op; daarna alleen het venster
+        vanaf _last_ts - POLL_OVERLAP.
+        """
+        if self._last_ts is None:
+            df = fetch_intraday(self.ticker)
+        else:
+            since = pd.Timestamp(self._last_ts, unit="ns", tz="UTC") - POLL_OVERLAP
+            df = fetch_intraday(self.ticker, start=since.to_pydatetime())
         if df is None:
             return []
 
-        candles = []
-        for ts, row in df.iterrows():
-            # Zorg dat tijdstempel tijdzone-bewust is
-            if ts.tzinfo is None:
-                ts = ts.tz_localize("UTC")
-            ts_cet = ts.tz_convert(CET)
+        # Zorg dat tijdstempels tijdzone-bewust zijn
+        idx = df.index if df.index.tz is not None else df.index.tz_localize("UTC")
+        ts_ns = idx.as_unit("ns").asi8
+
+        # Geen nieuwe bars → direct klaar, zonder rij-iteratie
+        if self._last_ts is not None:
+            if ts_ns[-1] <= self._last_ts:
+                return []
+            mask = ts_ns > self._last_ts
+            df, idx, ts_ns = df[mask], idx[mask], ts_ns[mask]
 
-            candles.append({
+        # Kolomsgewijs naar NumPy; tolist() geeft native floats/ints voor JSON
+        ohlc = df[["Open", "High", "Low", "Close"]].to_numpy(dtype=np.float64, copy=True)
+        np.round(ohlc, 4, out=ohlc)
+        ohlc = ohlc.tolist()
+        vol = df["Volume"].fillna(0).to_numpy(dtype=np.int64).tolist()  # altijd gevuld
+        idx_cet = idx.tz_convert(CET)
+        iso = [t.isoformat() for t in idx_cet]
+        # minuut van de dag op de CET-wandklok: integer-deling op de lokale ns
+        mod = ((idx_cet.tz_localize(None).as_unit("ns").asi8 // 60_000_000_000) % 1440).tolist()
+        ns = ts_ns.tolist()
+        candles = [
+            {
                 "symbol": self.ticker,
-                "time":   ts_cet.isoformat(),
-                "open":   round(float(row["Open"]),  4),
-                "high":   round(float(row["High"]),  4),
-                "low":    round(float(row["Low"]),   4),
-                "close":  round(float(row["Close"]), 4),
-                "volume": int(row["Volume"]),
-            })
+                "time":   iso[i],
+                "_ts_ns": ns[i],
+                "_mod":   mod[i],
+                "open":   o,
+                "high":   h,
+                "low":    l,
+                "close":  c,
+                "volume": vol[i],
+            }
+            for i, (o, h, l, c) in enumerate(ohlc)
+        ]
+        self._last_ts = ns[-1]
         return candles
 
     def stream_candles(self, limit=None):
@@ -58,21 +101,23 @@ class YFinanceFeed:
 
         # --- Initiële batch: de volledige dag tot nu ---
         for c in self._fetch():
-            if self._last_ts is None or c["time"] > self._last_ts:
-                self._last_ts = c["time"]
-                yield c
-                count += 1
-                if limit and count >= limit:
-                    return
+            yield c
+            count += 1
+            if limit and count >= limit:
+                return
 
-        # --- Live-polling: wacht 60s, haal nieuwe candles op ---
-        while True:
-            time.sleep(POLL_INTERVAL)
-            new = [c for c in self._fetch()
-                   if c["time"] > (self._last_ts or "")]
-            for c in new:
-                self._last_ts = c["time"]
-                yield c
-                count += 1
-                if limit and count >= limit:
+        # --- Live-polling: download start PREFETCH_LEAD s vóór het poll-moment ---
+        try:
+            while True:
+                if self._stop_event.wait(POLL_INTERVAL - PREFETCH_LEAD):
+                    return
+                pending = self._pool.submit(self._fetch)
+                if self._stop_event.wait(PREFETCH_LEAD):
                     return
+                for c in pending.result():
+                    yield c
+                    count += 1
+                    if limit and count >= limit:
+                        return
+        finally:
+            self._pool.shutdown(wait=False, cancel_futures=True)
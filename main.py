@@ -1,22 +1,25 @@
 import time
 import yaml
 import argparse
+import functools
 import os
 from data.mock_saxo import MockSaxoFeed
 from strategy.breakout import BreakoutStrategy
 from strategies.asml_setups import MorningGapFill
-from turbo.translate import TurboTranslator
+from turbo.translate import TurboTranslator, financiering_bij_turbo_prijs
 from ui.notifier import Notifier
 from ui.gui import ConfigUI, StatusWindow
 
 
+@functools.lru_cache(maxsize=1)
 def load_config(path="config.yaml"):
     with open(path, "r", encoding="utf-8") as f:
         return yaml.safe_load(f)
 
 
+@functools.lru_cache(maxsize=1)
 def parse_cli_args():
-    """Parse command-line arguments."""
+    """Parse command-line arguments (once; later calls return the cached result)."""
     parser = argparse.ArgumentParser(description="ASML Trading App")
     parser.add_argument("--leverage", type=float, help="Turbo leverage (3.00-4.00)")
     parser.add_argument("--turbo-entry", type=float, help="Turbo entry price (two decimals)")
@@ -95,7 +98,13 @@ def run_trading_loop(strategy, feed, turbo, notifier, manual_turbo_price, manual
             if signal:
                 # asml_price: use signal entry as trigger price
                 asml_price = float(signal.get("entry"))
-                turbo_vals = turbo.translate(signal, asml_price=asml_price, turbo_price=manual_turbo_price, ratio=manual_ratio)
+                # translate() needs a financing level: derive it from the manual
+                # turbo price at the trigger price (without one: error key only)
+                financing = None
+                if manual_turbo_price is not None and manual_ratio:
+                    financing = financiering_bij_turbo_prijs(
+                        asml_price, manual_turbo_price, manual_ratio, signal.get("side"))
+                turbo_vals = turbo.translate(signal, asml_price=asml_price, financing=financing, ratio=manual_ratio)
                 notifier.print_signal(signal, turbo_vals)
             time.sleep(0.05)
     except KeyboardInterrupt:
@@ -120,6 +129,7 @@ def main():
     gui_enabled = cfg.get("gui_mode", False)
 
     # If neither CLI/env vars provided, try GUI (if enabled and not --no-gui)
+    gui = None
     if manual_leverage is None and manual_turbo_price is None and not args.no_gui and gui_enabled:
         print("Launching config GUI...")
         gui = ConfigUI(cfg)
@@ -130,6 +140,7 @@ def main():
             manual_ratio = result.get("ratio")
             setup_choice = result.get("setup", setup_choice)
         else:
+            gui.destroy()
             print("GUI cancelled. Exiting.")
             return
 
@@ -211,7 +222,8 @@ def main():
     # Create status window if GUI was used to configure
     status_window = None
     if gui_enabled and (manual_leverage is not None or manual_turbo_price is not None or manual_ratio is not None):
-        status_window = StatusWindow(cfg)
+        # reuse the config window's Tk root when the GUI was shown
+        status_window = StatusWindow(cfg, parent=gui.window if gui else None)
         notifier = Notifier(status_window=status_window)
         
         # Run trading loop in background thread
@@ -226,6 +238,8 @@ def main():
         # This will block until user closes the window or clicks Stop
         status_window.mainloop()
         status_window.destroy()
+        if gui:
+            gui.destroy()
         trading_thread.join(timeout=2.0)
     else:
         # Non-GUI mode: run in main thread
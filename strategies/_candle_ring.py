@@ -0,0 +1,85 @@
+"""Fixed-size SoA ring buffer of candles for the strategies.
+
+One contiguous NumPy array per field instead of a deque of dicts, so window
+reductions (min/max/sum over the last k candles) are single NumPy calls.
+"""
+
+import numpy as np
+
+
+class CandleRing:
+    """Ring buffer of the last `size` candles, stored column-wise.
+
+    Fields: o, h, l, c (float64), v (int64), t (object: the candle's `time`).
+    `idx` is the next slot to write, `count` the number of candles pushed in
+    total. Slots are only meaningful for the last min(count, size) pushes;
+    use `tail(arr, k)` for the last k values of a field (a view unless the
+    window wraps) or `last_n(k)` for their slot indices, oldest first.
+    """
+
+    def __init__(self, size):
+        self.size = int(size)
+        self.o = np.zeros(self.size, dtype=np.float64)
+        self.h = np.zeros(self.size, dtype=np.float64)
+        self.l = np.zeros(self.size, dtype=np.float64)
+        self.c = np.zeros(self.size, dtype=np.float64)
+        self.v = np.zeros(self.size, dtype=np.int64)
+        self.t = np.empty(self.size, dtype=object)
+        self.idx = 0
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+    def push(self, candle):
+        """Append one candle dict (overwrites the oldest slot when full)."""
+        i = self.idx
+        self.o[i] = candle["open"]
+        self.h[i] = candle["high"]
+        self.l[i] = candle["low"]
+        self.c[i] = candle["close"]
+        self.v[i] = candle["volume"]
+        self.t[i] = candle["time"]
+        self.idx = (i + 1) % self.size
+        self.count += 1
+
+    def extend(self, o, h, l, c, v, t):
+        """Bulk-append equal-length columns (oldest first)."""
+        total = n = len(c)
+        if n > self.size:
+            o, h, l, c, v, t = (col[n - self.size:] for col in (o, h, l, c, v, t))
+            n = self.size
+        slots = (self.idx + np.arange(n)) % self.size
+        self.o[slots] = o
+        self.h[slots] = h
+        self.l[slots] = l
+        self.c[slots] = c
+        self.v[slots] = v
+        self.t[slots] = t
+        self.idx = (self.idx + n) % self.size
+        self.count += total
+
+    def clear(self):
+        self.idx = 0
+        self.count = 0
+
+    def slot(self, i):
+        """Slot index of the i-th candle from the end (i < 0, like a list)."""
+        return (self.idx + i) % self.size
+
+    def last_n(self, k):
+        """Slot indices of the last k candles (at most len(self)), oldest first."""
+        k = min(k, len(self))
+        return np.arange(self.idx - k, self.idx) % self.size
+
+    def tail(self, arr, k):
+        """Last k values (at most len(self)) of field array `arr`, oldest first.
+
+        A contiguous view of `arr` when the window does not wrap around the
+        end of the buffer; otherwise a small copy of the two pieces.
+        """
+        k = min(k, len(self))
+        i = self.idx
+        if k <= i:
+            return arr[i - k:i]
+        return np.concatenate((arr[self.size - (k - i):], arr[:i]))
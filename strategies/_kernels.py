@@ -0,0 +1,110 @@
+"""Numeric kernels for the strategies (Wilder ATR, breakout levels).
+
+wilder_atr(highs, lows, closes, period) returns the Wilder ATR over the
+whole arrays (oldest first), NaN if there are fewer than period+1 bars.
+wilder_atr_run(...) continues an incremental ATR state over a batch and
+returns the ATR after every bar (NaN until seeded) plus the new state.
+breakout_levels(highs, lows) returns (max(highs), min(lows)).
+
+Both operate on the SoA arrays of CandleRing / BreakoutStrategy. With numba
+they run as @njit(cache=True) loops; without numba the NumPy variants are
+used. Call `warmup()` once at start-up so the first candle does not pay the
+JIT compile (or cache load).
+"""
+
+import numpy as np
+
+from _njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _wilder_atr_njit(highs, lows, closes, period):
+    n = closes.shape[0]
+    if n < period + 1:
+        return np.nan
+    # first ATR is simple average of first `period` TRs
+    atr = 0.0
+    for i in range(1, n):
+        prev_close = closes[i - 1]
+        tr = max(highs[i] - lows[i], abs(highs[i] - prev_close), abs(lows[i] - prev_close))
+        if i <= period:
+            atr += tr
+            if i == period:
+                atr = atr / period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+def _wilder_atr_numpy(highs, lows, closes, period):
+    if len(closes) < period + 1:
+        return np.nan
+    prev_close = closes[:-1]
+    trs = np.maximum.reduce([
+        highs[1:] - lows[1:],
+        np.abs(highs[1:] - prev_close),
+        np.abs(lows[1:] - prev_close),
+    ]).tolist()
+    atr = sum(trs[:period]) / period
+    for tr in trs[period:]:
+        atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+@njit(cache=True)
+def wilder_atr_run(highs, lows, closes, prev_close, atr, boot_sum, boot_n, period):
+    """Continue a Wilder ATR state (prev_close NaN = no bar yet) over a batch.
+
+    Same operations, in the same order, as a bar-by-bar update: the first
+    `period` TRs are summed and averaged, then smoothed. Sequential by
+    nature, so without numba this runs as a plain Python loop.
+    Returns (atr_per_bar, prev_close, atr, boot_sum, boot_n).
+    """
+    n = closes.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(n):
+        if not np.isnan(prev_close):
+            tr = max(highs[i] - lows[i], abs(highs[i] - prev_close), abs(lows[i] - prev_close))
+            if boot_n >= period:
+                atr = (atr * (period - 1) + tr) / period
+            else:
+                boot_sum += tr
+                boot_n += 1
+                if boot_n == period:
+                    atr = boot_sum / period
+        prev_close = closes[i]
+        if boot_n >= period:
+            out[i] = atr
+    return out, prev_close, atr, boot_sum, boot_n
+
+
+@njit(cache=True)
+def _breakout_levels_njit(highs, lows):
+    hi = highs[0]
+    lo = lows[0]
+    for i in range(1, highs.shape[0]):
+        if highs[i] > hi:
+            hi = highs[i]
+        if lows[i] < lo:
+            lo = lows[i]
+    return hi, lo
+
+
+def _breakout_levels_numpy(highs, lows):
+    return highs.max(), lows.min()
+
+
+if NUMBA_AVAILABLE:
+    wilder_atr = _wilder_atr_njit
+    breakout_levels = _breakout_levels_njit
+else:
+    wilder_atr = _wilder_atr_numpy
+    breakout_levels = _breakout_levels_numpy
+
+
+def warmup():
+    """Compile (or load from cache) the kernels with a dummy call."""
+    x = np.ones(3, dtype=np.float64)
+    wilder_atr(x, x, x, 2)
+    wilder_atr_run(x, x, x, np.nan, np.nan, 0.0, 0, 2)
+    breakout_levels(x, x)
@@ -1,8 +1,11 @@
 from datetime import datetime, time as dtime, timedelta
-from collections import deque
+import numpy as np
 import pandas as pd
 import math
 
+from strategies._candle_ring import CandleRing
+from strategies._kernels import wilder_atr, wilder_atr_run
+
 
 class MorningGapFill:
     """Morning Gap Fill setup (converted from ASML_Trading_Setups_Details.xlsx).
@@ -19,13 +22,19 @@ class MorningGapFill:
       - The workbook lists the setup parameters; this class exposes config
         to tune thresholds and integrates with minute-candle feeds.
       - Before using, call `set_prev_close(price)` with the previous day's close.
+      - The Wilder ATR used for the SL buffer is updated incrementally on
+        every candle; `compute_atr` recomputes it from the full history.
     """
 
+    ATR_PERIOD = 14
+
     def __init__(self, cfg=None):
         cfg = cfg or {}
         # time window strings 'HH:MM'
         self.start = self._parse_time(cfg.get("start", "08:05"))
         self.end = self._parse_time(cfg.get("end", "09:00"))
+        self._start_mod = _minute_of_day(self.start)
+        self._end_mod = _minute_of_day(self.end)
         self.gap_min = float(cfg.get("gap_min", 10.0))
         self.vol_min = int(cfg.get("vol_min", 5000))
         self.tp_ratio = float(cfg.get("tp_ratio", 1.5))
@@ -39,7 +48,14 @@ class MorningGapFill:
         self.first_open = None
         self.detected_gap = False
         self.active = False
-        self.candle_history = deque(maxlen=1000)
+        self.candle_history = CandleRing(1000)
+
+        # incremental Wilder ATR state
+        self._atr = None
+        self._atr_ready = False
+        self._atr_boot_sum = 0.0
+        self._atr_boot_n = 0
+        self._prev_close_bar = None
 
     def _parse_time(self, s):
         h, m = (int(x) for x in s.split(":"))
@@ -54,30 +70,35 @@ class MorningGapFill:
         Expects ISO timestamps in the time_col. This helps compute ATR when
         live candle_history is not yet populated.
         """
-        try:
-            df = pd.read_excel(path, engine="openpyxl")
-        except Exception:
-            df = pd.read_excel(path)
+        # Named columns: read only the fields we need. If they are not all
+        # there (export format without headers), read the whole sheet and
+        # auto-detect below.
+        required = [time_col, open_col, high_col, low_col, close_col]
+        with _open_excel(path) as xl:
+            try:
+                df = xl.parse(0, usecols=required + [vol_col])
+            except ValueError:
+                df = xl.parse(0)
 
         # If the file already has proper named columns, use them
-        required = [time_col, open_col, high_col, low_col, close_col]
         if all(c in df.columns for c in required):
-            data = df.copy()
-            data = data.dropna(subset=[time_col, open_col, high_col, low_col, close_col])
+            # dropna already returns a new frame; no upfront copy of the sheet
+            data = df.dropna(subset=[time_col, open_col, high_col, low_col, close_col])
             data[time_col] = pd.to_datetime(data[time_col], errors='coerce')
         else:
             # Try to auto-detect header row and column mapping (common export format)
             # Find first row that looks like a datetime in first column
             start_idx = None
             for i, v in enumerate(df.iloc[:, 0].values):
-                if pd.notna(v) and isinstance(v, (pd.Timestamp, str)):
+                # NaN / NaT are never a Timestamp or str, so no pd.notna() needed
+                if isinstance(v, (pd.Timestamp, str)):
                     s = str(v)
                     if any(ch.isdigit() for ch in s) and ("-" in s or ":" in s):
                         start_idx = i
                         break
             if start_idx is None:
                 return False
-            data = df.iloc[start_idx:].copy()
+            data = df.iloc[start_idx:]  # rename/dropna below return new frames
             # Map likely columns: time, close, high, low, open, volume
             cols = list(data.columns)
             mapping = {}
@@ -97,27 +118,54 @@ class MorningGapFill:
             data = data.dropna(subset=[time_col, open_col, high_col, low_col, close_col])
             data[time_col] = pd.to_datetime(data[time_col], utc=True, errors='coerce')
 
-        # clear existing history and append rows
+        # columnar conversion; rows with a non-numeric OHLC value are skipped
+        ohlc = data[[open_col, high_col, low_col, close_col]].apply(pd.to_numeric, errors="coerce")
+        ok = ohlc.notna().all(axis=1).to_numpy()
+        o, h, l, c = (ohlc[col].to_numpy(np.float64)[ok]
+                      for col in (open_col, high_col, low_col, close_col))
+        t = data[time_col][ok].to_numpy(dtype=object)
+        if vol_col in data.columns:
+            v = data[vol_col][ok].fillna(0).to_numpy(np.float64).astype(np.int64)
+        else:
+            v = np.zeros(len(o), dtype=np.int64)
+
+        # clear existing history and append the columns
         self.candle_history.clear()
-        for _, row in data.iterrows():
-            try:
-                o = float(row[open_col])
-                h = float(row[high_col])
-                l = float(row[low_col])
-                c = float(row[close_col])
-            except Exception:
-                continue
-            candle = {
-                "time": row[time_col],
-                "open": o,
-                "high": h,
-                "low": l,
-                "close": c,
-                "volume": int(row[vol_col]) if vol_col in row and not pd.isna(row[vol_col]) else 0,
-            }
-            self.candle_history.append(candle)
+        self.candle_history.extend(o, h, l, c, v, t)
+        self._rebuild_atr()
         return True
 
+    def _update_atr(self, high, low, close):
+        """Advance the Wilder ATR by one bar (a few float ops)."""
+        prev_close = self._prev_close_bar
+        self._prev_close_bar = close
+        if prev_close is None:
+            return
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        period = self.ATR_PERIOD
+        if self._atr_ready:
+            self._atr = (self._atr * (period - 1) + tr) / period
+            return
+        # first ATR is simple average of first `period` TRs
+        self._atr_boot_sum += tr
+        self._atr_boot_n += 1
+        if self._atr_boot_n == period:
+            self._atr = self._atr_boot_sum / period
+            self._atr_ready = True
+
+    def _rebuild_atr(self):
+        """Re-seed the incremental ATR from candle_history (after a reload)."""
+        self._atr = None
+        self._atr_ready = False
+        self._atr_boot_sum = 0.0
+        self._atr_boot_n = 0
+        self._prev_close_bar = None
+        ring = self.candle_history
+        n = len(ring)
+        for h, l, c in zip(ring.tail(ring.h, n).tolist(), ring.tail(ring.l, n).tolist(),
+                           ring.tail(ring.c, n).tolist()):
+            self._update_atr(h, l, c)
+
     def compute_atr(self, period=14, method="wilder"):
         """Compute ATR over `period` periods from `self.candle_history`.
 
@@ -126,49 +174,72 @@ class MorningGapFill:
         if len(self.candle_history) < period + 1:
             return None
 
-        # Build lists of high, low, close
-        highs = [float(c["high"]) for c in self.candle_history if c.get("high") is not None]
-        lows = [float(c["low"]) for c in self.candle_history if c.get("low") is not None]
-        closes = [float(c["close"]) for c in self.candle_history if c.get("close") is not None]
+        ring = self.candle_history
+        n = len(ring)
+        highs, lows, closes = ring.tail(ring.h, n), ring.tail(ring.l, n), ring.tail(ring.c, n)
+
+        # Wilder's smoothing (JIT kernel when numba is available)
+        if method == "wilder":
+            return round(float(wilder_atr(highs, lows, closes, period)), 6)
 
         # compute True Range series
-        trs = []
-        for i in range(1, len(closes)):
-            high = highs[i]
-            low = lows[i]
-            prev_close = closes[i - 1]
-            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-            trs.append(tr)
-
-        if len(trs) < period:
-            return None
+        prev_close = closes[:-1]
+        trs = np.maximum.reduce([
+            highs[1:] - lows[1:],
+            np.abs(highs[1:] - prev_close),
+            np.abs(lows[1:] - prev_close),
+        ]).tolist()
 
-        # Wilder's smoothing
-        if method == "wilder":
-            # first ATR is simple average of first `period` TRs
-            atr = sum(trs[:period]) / period
-            for tr in trs[period:]:
-                atr = (atr * (period - 1) + tr) / period
-            return round(atr, 6)
+        # simple moving average of last `period` TRs
+        return round(sum(trs[-period:]) / period, 6)
+
+    def _in_window(self, candle):
+        return _ts_in_window(candle, self._start_mod, self._end_mod)
+
+    def _signal(self, symbol, time, entry, atr, lowest_low):
+        """LONG signal dict for an entry at `entry`; clears the gap detection.
+
+        `atr` is the rounded ATR (None while it is not ready yet) and
+        `lowest_low` the lowest low of the last `lookback` candles.
+        """
+        # Determine SL buffer: if ATR available, use ATR-based buffer with floor
+        if atr is not None:
+            buffer = max(self.atr_min, round(self.atr_k * atr, 6))
+        else:
+            buffer = self.sl_buffer
+
+        # SL = lowest low of recent candles minus buffer
+        sl = lowest_low - buffer
+        # TP = aim for fill toward prev_close (or use tp_ratio)
+        dist_to_fill = self.prev_close - entry
+        if dist_to_fill <= 0:
+            tp = entry + (entry - sl) * self.tp_ratio
         else:
-            # simple moving average of last `period` TRs
-            return round(sum(trs[-period:]) / period, 6)
-
-    def _in_window(self, ts_iso):
-        # ts_iso expected like 2026-02-18T08:05:00Z or similar
-        try:
-            ts = datetime.fromisoformat(ts_iso.replace("Z", ""))
-        except Exception:
-            return False
-        t = ts.time()
-        return (t >= self.start) and (t <= self.end)
+            tp = entry + dist_to_fill  # aim to fill the gap
+
+        # reset detection to avoid duplicate signals
+        self.detected_gap = False
+        return {
+            "side": "LONG",
+            "symbol": symbol,
+            "time": time,
+            "entry": round(entry, 4),
+            "sl": round(sl, 4),
+            "tp": round(tp, 4),
+            "meta": {
+                "setup_name": "Morning Gap Fill",
+                "prev_close": float(self.prev_close),
+                "first_open": float(self.first_open),
+            },
+        }
 
     def on_candle(self, candle):
         """Process a 1-minute `candle` dict and return a signal dict or None.
 
         Candle keys: symbol, time (ISO), open, high, low, close, volume
         """
-        self.candle_history.append(candle)
+        self.candle_history.push(candle)
+        self._update_atr(candle["high"], candle["low"], candle["close"])
 
         # require previous close to be set
         if self.prev_close is None:
@@ -176,11 +247,11 @@ class MorningGapFill:
 
         if not self.first_open:
             # treat the first candle in the session as opening reference
-            if self._in_window(candle.get("time", "")):
-                self.first_open = float(candle["open"]) if candle.get("open") is not None else None
+            if self._in_window(candle):
+                self.first_open = candle["open"]
                 # detect gap down
                 gap = self.prev_close - self.first_open
-                if gap >= self.gap_min and candle.get("volume", 0) >= self.vol_min:
+                if gap >= self.gap_min and candle["volume"] >= self.vol_min:
                     self.detected_gap = True
                     # start watching for recovery
                 return None
@@ -188,67 +259,182 @@ class MorningGapFill:
                 return None
 
         # if a qualifying gap down was detected and we're in the time window
-        if self.detected_gap and self._in_window(candle.get("time", "")):
+        if self.detected_gap and self._in_window(candle):
             # quick entry rule: price shows a higher close compared to previous candle
-            if len(self.candle_history) >= 2:
-                prev = self.candle_history[-2]
+            ring = self.candle_history
+            if len(ring) >= 2:
                 # require increasing close
-                if float(candle["close"]) > float(prev["close"]):
-                    entry = float(candle["close"])
-                    # Determine SL buffer: if ATR available, use ATR-based buffer with floor
-                    atr = self.compute_atr(period=14)
-                    if atr is not None:
-                        buffer = max(self.atr_min, round(self.atr_k * atr, 6))
-                    else:
-                        buffer = self.sl_buffer
-
-                    # SL = lowest low of recent candles minus buffer
-                    lows = [float(c.get("low", entry)) for c in list(self.candle_history)[-self.lookback:]]
-                    sl = min(lows) - buffer
-                    # TP = aim for fill toward prev_close (or use tp_ratio)
-                    dist_to_fill = self.prev_close - entry
-                    if dist_to_fill <= 0:
-                        tp = entry + (entry - sl) * self.tp_ratio
-                    else:
-                        tp = entry + dist_to_fill  # aim to fill the gap
-
-                    # create a LONG signal
-                    signal = {
-                        "side": "LONG",
-                        "symbol": candle.get("symbol"),
-                        "time": candle.get("time"),
-                        "entry": round(entry, 4),
-                        "sl": round(sl, 4),
-                        "tp": round(tp, 4),
-                        "meta": {
-                            "setup_name": "Morning Gap Fill",
-                            "prev_close": float(self.prev_close),
-                            "first_open": float(self.first_open),
-                        },
-                    }
-                    # reset detection to avoid duplicate signals
-                    self.detected_gap = False
-                    return signal
+                if candle["close"] > ring.c[ring.slot(-2)]:
+                    atr = round(self._atr, 6) if self._atr_ready else None
+                    return self._signal(
+                        candle["symbol"], candle["time"], candle["close"], atr,
+                        float(ring.tail(ring.l, self.lookback).min()))
 
         return None
 
+    def on_candles_batch(self, data):
+        """Backtest entry point: process_batch on a DataFrame / dict of columns.
+
+        Columns: time, open, high, low, close, volume (optional symbol and
+        mod), oldest first. Returns the signals as a DataFrame, one row each.
+        """
+        symbol = np.asarray(data["symbol"], dtype=object)[0] if "symbol" in data and len(data["close"]) else None
+        signals = self.process_batch(
+            data["open"], data["high"], data["low"], data["close"], data["volume"],
+            data["time"], symbol=symbol, mod_arr=data["mod"] if "mod" in data else None)
+        return pd.DataFrame(signals, columns=_SIGNAL_COLUMNS)
+
+    def process_batch(self, open_arr, high_arr, low_arr, close_arr, vol_arr, ts_arr,
+                      symbol=None, mod_arr=None):
+        """Vectorized equivalent of calling on_candle for every candle in the batch.
+
+        Arrays are equal-length columns (oldest first); `mod_arr` is the
+        minute of day per candle, derived from `ts_arr` when omitted. Gives
+        the same signals, in time order, and leaves the same state as the
+        scalar path, but the ATR runs as one kernel pass and the entry
+        search uses NumPy masks.
+        """
+        o = np.asarray(open_arr, dtype=np.float64)
+        h = np.asarray(high_arr, dtype=np.float64)
+        l = np.asarray(low_arr, dtype=np.float64)
+        c = np.asarray(close_arr, dtype=np.float64)
+        v = np.asarray(vol_arr, dtype=np.int64)
+        mods = (np.asarray(mod_arr, dtype=np.int64) if mod_arr is not None
+                else _times_to_mod(ts_arr))
+        times = np.asarray(ts_arr, dtype=object)
+        n = len(c)
+        ring = self.candle_history
+        prev_bar_close = ring.c[ring.slot(-1)] if len(ring) else np.nan
+        hist_lows = ring.tail(ring.l, self.lookback - 1) if self.lookback > 1 else ring.l[:0]
+
+        # ATR after every bar, continuing the incremental state
+        atr_bars, prev_close, atr, boot_sum, boot_n = wilder_atr_run(
+            h, l, c,
+            np.nan if self._prev_close_bar is None else self._prev_close_bar,
+            self._atr if self._atr_ready else np.nan,
+            self._atr_boot_sum, self._atr_boot_n, self.ATR_PERIOD)
+        self._prev_close_bar = None if np.isnan(prev_close) else float(prev_close)
+        self._atr_boot_sum, self._atr_boot_n = float(boot_sum), int(boot_n)
+        if self._atr_boot_n >= self.ATR_PERIOD:
+            self._atr, self._atr_ready = float(atr), True
+        ring.extend(o, h, l, c, v, times)
+
+        signals = []
+        if self.prev_close is None or n == 0:
+            return signals
+
+        in_window = (mods >= self._start_mod) & (mods <= self._end_mod)
+        start = 0
+        if not self.first_open:
+            hits = np.flatnonzero(in_window)
+            if len(hits) == 0:
+                return signals
+            f = int(hits[0])
+            self.first_open = float(o[f])
+            gap = self.prev_close - self.first_open
+            if gap >= self.gap_min and v[f] >= self.vol_min:
+                self.detected_gap = True
+            start = f + 1
+
+        if self.detected_gap:
+            prev_c = np.concatenate(([prev_bar_close], c[:-1]))
+            # NaN (no previous bar) compares False, like len(history) < 2
+            rising = in_window & (c > prev_c)
+            rising[:start] = False
+            hits = np.flatnonzero(rising)
+            if len(hits):
+                j = int(hits[0])
+                atr_j = atr_bars[j]
+                atr = None if np.isnan(atr_j) else round(float(atr_j), 6)
+                lows = np.concatenate((hist_lows, l[:j + 1]))[-self.lookback:]
+                signals.append(self._signal(symbol, times[j], float(c[j]), atr,
+                                            float(lows.min())))
+        return signals
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+def _open_excel(path):
+    """pd.ExcelFile via the Rust-based calamine engine, openpyxl as fallback.
+
+    calamine needs python-calamine (pandas >= 2.2). The handle parses the
+    workbook once, so several parse() calls (or sheets) share it.
+    """
+    try:
+        return pd.ExcelFile(path, engine="calamine")
+    except ImportError:
+        pass  # python-calamine not installed
+    except ValueError as exc:
+        if "calamine" not in str(exc):  # "Unknown engine: calamine" on older pandas
+            raise
+    try:
+        return pd.ExcelFile(path, engine="openpyxl")
+    except Exception:
+        return pd.ExcelFile(path)
+
+
 def _parse_time_str(s):
     h, m = (int(x) for x in s.split(":"))
     return dtime(hour=h, minute=m)
 
 
-def _ts_in_window(ts_iso, start, end):
+_SIGNAL_COLUMNS = ["side", "symbol", "time", "entry", "sl", "tp", "meta"]
+
+
+# Candle contract: the feeds (data/mock_saxo.py, data/yfinance_feed.py) emit
+# each candle once as a dict that always has symbol and time, native floats
+# for open/high/low/close, an int volume (0 if unknown) and `_mod`, its
+# minute of day (0-1439) computed from the epoch-ns timestamp at ingestion;
+# the same dict is handed to every strategy by reference. Strategies
+# therefore read the fields as-is with plain subscripts (no .get()
+# defaults, no float() re-casts), and a time-window check is an integer
+# compare.
+
+def _candle_time(candle):
+    """Time of day parsed from a candle's `time`, or None if unparseable.
+
+    Fallback for candles without `_mod` (Excel, tests); `time` is expected
+    like 2026-02-18T08:05:00Z.
+    """
     try:
-        ts = datetime.fromisoformat(ts_iso.replace("Z", ""))
+        return datetime.fromisoformat(candle.get("time", "").replace("Z", "")).time()
     except Exception:
-        return False
-    t = ts.time()
-    return start <= t <= end
+        return None
+
+
+def _minute_of_day(t):
+    return t.hour * 60 + t.minute
+
+
+def _candle_mod(candle):
+    """Minute of day (0-1439) of a candle, or None if it has no valid time."""
+    mod = candle.get("_mod")
+    if mod is not None:
+        return mod
+    t = _candle_time(candle)
+    return None if t is None else t.hour * 60 + t.minute
+
+
+def _times_to_mod(times):
+    """Minute of day per element of a time column; -1 where unparseable."""
+    if hasattr(times, "dt"):  # datetime64 Series (e.g. from the Excel loader)
+        return (times.dt.hour * 60 + times.dt.minute).fillna(-1).to_numpy(np.int64)
+    mods = np.empty(len(times), dtype=np.int64)
+    for i, t in enumerate(times):
+        if isinstance(t, str):
+            t = _candle_time({"time": t})
+        elif hasattr(t, "hour") and hasattr(t, "date"):
+            t = t.time()
+        mods[i] = -1 if t is None else t.hour * 60 + t.minute
+    return mods
+
+
+def _ts_in_window(candle, start_mod, end_mod):
+    """start_mod <= minute of day <= end_mod (whole minutes, both inclusive)."""
+    mod = _candle_mod(candle)
+    return mod is not None and start_mod <= mod <= end_mod
 
 
 # ---------------------------------------------------------------------------
@@ -276,58 +462,52 @@ class MorningMomentum:
         cfg = cfg or {}
         self.start = _parse_time_str(cfg.get("start", "09:15"))
         self.end = _parse_time_str(cfg.get("end", "10:00"))
+        self._start_mod = _minute_of_day(self.start)
+        self._end_mod = _minute_of_day(self.end)
         self.vol_min = int(cfg.get("vol_min", 3000))
         self.n_confirm = int(cfg.get("n_confirm", 2))
         self.tp_ratio = float(cfg.get("tp_ratio", 1.75))
         self.sl_lookback = int(cfg.get("sl_lookback", 3))
 
-        self.candle_history = deque(maxlen=500)
+        self.candle_history = CandleRing(500)
         self.signal_fired = False
 
     def on_candle(self, candle):
-        self.candle_history.append(candle)
-
+        # cheap gates first; after the signal the history is never read again
         if self.signal_fired:
             return None
-        if not _ts_in_window(candle.get("time", ""), self.start, self.end):
+        ring = self.candle_history
+        ring.push(candle)
+
+        if candle["volume"] < self.vol_min:
             return None
-        if candle.get("volume", 0) < self.vol_min:
+        if len(ring) < self.n_confirm + 1:
             return None
-        if len(self.candle_history) < self.n_confirm + 1:
+        if not _ts_in_window(candle, self._start_mod, self._end_mod):
             return None
 
-        recent = list(self.candle_history)[-(self.n_confirm + 1):]
-
-        long_ok = all(
-            float(recent[i + 1]["high"]) > float(recent[i]["high"]) and
-            float(recent[i + 1]["low"]) > float(recent[i]["low"])
-            for i in range(self.n_confirm)
-        )
-        short_ok = all(
-            float(recent[i + 1]["low"]) < float(recent[i]["low"]) and
-            float(recent[i + 1]["high"]) < float(recent[i]["high"])
-            for i in range(self.n_confirm)
-        )
+        k = self.n_confirm + 1
+        h, lo = ring.tail(ring.h, k), ring.tail(ring.l, k)
+        long_ok = bool(np.all((h[1:] > h[:-1]) & (lo[1:] > lo[:-1])))
+        short_ok = bool(np.all((lo[1:] < lo[:-1]) & (h[1:] < h[:-1])))
 
         if not long_ok and not short_ok:
             return None
 
         side = "LONG" if long_ok else "SHORT"
-        entry = float(candle["close"])
-        lookback = list(self.candle_history)[-self.sl_lookback:]
-
+        entry = candle["close"]
         if side == "LONG":
-            sl = min(float(c["low"]) for c in lookback)
+            sl = float(ring.tail(ring.l, self.sl_lookback).min())
             tp = entry + abs(entry - sl) * self.tp_ratio
         else:
-            sl = max(float(c["high"]) for c in lookback)
+            sl = float(ring.tail(ring.h, self.sl_lookback).max())
             tp = entry - abs(sl - entry) * self.tp_ratio
 
         self.signal_fired = True
         return {
             "side": side,
-            "symbol": candle.get("symbol"),
-            "time": candle.get("time"),
+            "symbol": candle["symbol"],
+            "time": candle["time"],
             "entry": round(entry, 4),
             "sl": round(sl, 4),
             "tp": round(tp, 4),
@@ -358,13 +538,17 @@ class OpeningRangeBreak:
         self.range_start = _parse_time_str(cfg.get("range_start", "08:05"))
         self.range_end = _parse_time_str(cfg.get("range_end", "08:20"))
         self.break_end = _parse_time_str(cfg.get("break_end", "08:45"))
+        self._range_start_mod = _minute_of_day(self.range_start)
+        self._range_end_mod = _minute_of_day(self.range_end)
+        self._break_end_mod = _minute_of_day(self.break_end)
         self.vol_min = int(cfg.get("vol_min", 5000))
         self.tp_ratio = float(cfg.get("tp_ratio", 1.3))
         self.range_n_candles = int(cfg.get("range_n_candles", 15))
         self.force_window = bool(cfg.get("force_window", False))
 
-        self.range_high: float | None = None
-        self.range_low: float | None = None
+        # ±inf: every range update is a plain max/min, no None check
+        self.range_high = float("-inf")
+        self.range_low = float("inf")
         self.range_built = False
         self.signal_fired = False
         self._candles_seen = 0
@@ -373,42 +557,40 @@ class OpeningRangeBreak:
         if self.signal_fired:
             return None
 
-        ts = candle.get("time", "")
-        h = float(candle["high"])
-        lo = float(candle["low"])
-        close = float(candle["close"])
+        h = candle["high"]
+        lo = candle["low"]
+        close = candle["close"]
 
         if self.force_window:
             # Phase 1: count-based range building
             if not self.range_built:
                 self._candles_seen += 1
-                self.range_high = h if self.range_high is None else max(self.range_high, h)
-                self.range_low = lo if self.range_low is None else min(self.range_low, lo)
+                self.range_high = max(self.range_high, h)
+                self.range_low = min(self.range_low, lo)
                 if self._candles_seen >= self.range_n_candles:
                     self.range_built = True
                 return None
             # Phase 2: watch for breakout (no time limit)
         else:
             # Time-based Phase 1
-            try:
-                t = datetime.fromisoformat(ts.replace("Z", "")).time()
-            except Exception:
+            mod = _candle_mod(candle)
+            if mod is None:
                 return None
 
-            if self.range_start <= t < self.range_end:
-                self.range_high = h if self.range_high is None else max(self.range_high, h)
-                self.range_low = lo if self.range_low is None else min(self.range_low, lo)
+            if self._range_start_mod <= mod < self._range_end_mod:
+                self.range_high = max(self.range_high, h)
+                self.range_low = min(self.range_low, lo)
                 return None
 
-            if self.range_high is not None and not self.range_built:
+            if self.range_high > float("-inf") and not self.range_built:
                 self.range_built = True
 
             if not self.range_built:
                 return None
-            if not (self.range_end <= t <= self.break_end):
+            if not (self._range_end_mod <= mod <= self._break_end_mod):
                 return None
 
-        if candle.get("volume", 0) < self.vol_min:
+        if candle["volume"] < self.vol_min:
             return None
 
         range_size = self.range_high - self.range_low
@@ -429,8 +611,8 @@ class OpeningRangeBreak:
             self.signal_fired = True
             return {
                 "side": side,
-                "symbol": candle.get("symbol"),
-                "time": ts,
+                "symbol": candle["symbol"],
+                "time": candle["time"],
                 "entry": round(close, 4),
                 "sl": round(sl, 4),
                 "tp": round(tp, 4),
@@ -470,41 +652,55 @@ class ClosingReversion:
         cfg = cfg or {}
         self.start = _parse_time_str(cfg.get("start", "16:00"))
         self.end = _parse_time_str(cfg.get("end", "16:25"))
+        self._start_mod = _minute_of_day(self.start)
+        self._end_mod = _minute_of_day(self.end)
         self.vol_min = int(cfg.get("vol_min", 3000))
         self.vwap_threshold = float(cfg.get("vwap_threshold", 10.0))
         self.sl_buffer = float(cfg.get("sl_buffer", 4.0))
         self.tp_buffer = float(cfg.get("tp_buffer", 2.0))
 
-        self.all_candles: deque = deque(maxlen=5000)
+        self.all_candles = CandleRing(5000)
         self.signal_fired = False
+        # running VWAP sums over all_candles
+        self._vol_sum = 0
+        self._tpv_sum = 0.0
+
+    def _append(self, candle):
+        """Append to all_candles and keep the VWAP sums in step (evicting the oldest)."""
+        ring = self.all_candles
+        if ring.count >= ring.size:
+            j = ring.idx  # oldest slot, overwritten by the push below
+            vol = int(ring.v[j])
+            self._tpv_sum -= ((float(ring.h[j]) + float(ring.l[j]) + float(ring.c[j])) / 3) * vol
+            self._vol_sum -= vol
+        ring.push(candle)
+        vol = candle["volume"]
+        self._tpv_sum += ((candle["high"] + candle["low"] + candle["close"]) / 3) * vol
+        self._vol_sum += vol
 
     def _compute_vwap(self):
-        total_vol = sum(c.get("volume", 0) for c in self.all_candles)
-        if total_vol == 0:
+        if self._vol_sum == 0:
             return None
-        tpv = sum(
-            ((float(c["high"]) + float(c["low"]) + float(c["close"])) / 3) * c.get("volume", 0)
-            for c in self.all_candles
-        )
-        return round(tpv / total_vol, 4)
+        return round(self._tpv_sum / self._vol_sum, 4)
 
     def on_candle(self, candle):
-        self.all_candles.append(candle)
-
+        # cheap gates first; after the signal the VWAP is never read again
         if self.signal_fired:
             return None
-        if not _ts_in_window(candle.get("time", ""), self.start, self.end):
-            return None
-        if candle.get("volume", 0) < self.vol_min:
+        self._append(candle)
+
+        if candle["volume"] < self.vol_min:
             return None
         if len(self.all_candles) < 10:
             return None
+        if not _ts_in_window(candle, self._start_mod, self._end_mod):
+            return None
 
         vwap = self._compute_vwap()
         if vwap is None:
             return None
 
-        close = float(candle["close"])
+        close = candle["close"]
         deviation = close - vwap
 
         if abs(deviation) < self.vwap_threshold:
@@ -524,8 +720,8 @@ class ClosingReversion:
         self.signal_fired = True
         return {
             "side": side,
-            "symbol": candle.get("symbol"),
-            "time": candle.get("time"),
+            "symbol": candle["symbol"],
+            "time": candle["time"],
             "entry": round(entry, 4),
             "sl": sl,
             "tp": tp,
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from strategies._kernels import breakout_levels
+
 
 class BreakoutStrategy:
     """Simple breakout setup.
@@ -9,6 +12,16 @@ class BreakoutStrategy:
       - vol_ma: int (rolling window for average volume)
       - vol_mult: float (min volume relative to avg)
       - tp_ratio: float (reward/risk)
+
+    State is a fixed-size ring buffer of the last max(lookback, vol_ma)
+    highs/lows/volumes plus a running volume sum, so `on_candle` is O(1) in
+    the length of the session. At most one signal fires per session (the
+    calendar date of the candle `time`); after it, candles only update the
+    buffer until the date changes.
+
+    Besides the streaming `on_candle`, `process_batch` evaluates a whole
+    batch of candles (column arrays) with rolling-window operations;
+    `on_candles_batch` wraps it for backtests on a DataFrame.
     """
 
     def __init__(self, cfg=None):
@@ -18,58 +31,194 @@ class BreakoutStrategy:
         self.vol_mult = float(cfg.get("vol_mult", 1.5))
         self.tp_ratio = float(cfg.get("tp_ratio", 2.0))
 
-        self.df = pd.DataFrame(columns=["time", "open", "high", "low", "close", "volume"]) 
+        # ring buffer of the previous candles (the current one is not in it)
+        self._size = max(self.lookback, self.vol_ma, 1)
+        self.highs = np.empty(self._size, dtype=np.float64)
+        self.lows = np.empty(self._size, dtype=np.float64)
+        self.vols = np.empty(self._size, dtype=np.float64)
+        self._idx = 0        # next slot to write
+        self._count = 0      # candles seen so far
+        self._vol_sum = 0.0  # sum of the last vol_ma volumes in the buffer
 
-    def on_candle(self, candle):
-        # append
-        row = {
-            "time": candle["time"],
-            "open": candle["open"],
-            "high": candle["high"],
-            "low": candle["low"],
-            "close": candle["close"],
-            "volume": candle["volume"],
-        }
-        self.df = pd.concat([self.df, pd.DataFrame([row])], ignore_index=True)
-        if len(self.df) < max(self.lookback, self.vol_ma) + 1:
-            return None
+        self.signal_fired = False
+        self.session_date = None
+
+    def _push(self, high, low, volume):
+        n = self._size
+        i = self._idx
+        if self._count >= self.vol_ma:
+            # evict the volume that drops out of the vol_ma window (read before overwrite)
+            self._vol_sum -= self.vols[(i - self.vol_ma) % n]
+        self._vol_sum += volume
+        self.highs[i] = high
+        self.lows[i] = low
+        self.vols[i] = volume
+        self._idx = (i + 1) % n
+        self._count += 1
 
-        df = self.df.copy().astype({"open": float, "high": float, "low": float, "close": float, "volume": int})
+    def _last(self, buf, k):
+        """Last k buffer entries, oldest first.
 
-        latest = df.iloc[-1]
-        prev_window = df.iloc[-(self.lookback + 1):-1]
-        vol_ma = prev_window["volume"].rolling(self.vol_ma).mean().iloc[-1]
-        if pd.isna(vol_ma):
+        Sliced directly around the write index (a view unless the window
+        wraps) instead of rolling the whole buffer first.
+        """
+        i = self._idx
+        if k <= i:
+            return buf[i - k:i]
+        return np.concatenate((buf[self._size - (k - i):], buf[:i]))
+
+    def on_candle(self, candle):
+        # the feeds deliver native floats / int volume and the ring buffers
+        # are typed float64, so no per-candle casts are needed
+        high = candle["high"]
+        low = candle["low"]
+        close = candle["close"]
+        volume = candle["volume"]
+
+        day = _session_date(candle["time"])
+        if day != self.session_date:
+            self.session_date = day
+            self.signal_fired = False
+        if self.signal_fired:
+            # keep the window contiguous for the next session, skip the rest
+            self._push(high, low, volume)
             return None
 
-        # breakout long: close > previous high
-        prev_high = prev_window["high"].max()
-        prev_low = prev_window["low"].min()
+        # need max(lookback, vol_ma) previous candles; the vol MA over a
+        # lookback window is undefined when vol_ma > lookback
+        ready = self._count >= self._size and self.vol_ma <= self.lookback
+        if ready:
+            vol_ma = self._vol_sum / self.vol_ma
+            # buffer size == lookback here, so the whole buffer is the window
+            prev_high, prev_low = breakout_levels(self.highs, self.lows)
+        self._push(high, low, volume)
+        if not ready:
+            return None
 
         entry = None
         side = None
-        if latest["close"] > prev_high and latest["volume"] > vol_ma * self.vol_mult:
+        if close > prev_high and volume > vol_ma * self.vol_mult:
             side = "LONG"
-            entry = latest["close"]
+            entry = close
             sl = prev_low
             tp = entry + (entry - sl) * self.tp_ratio
-        elif latest["close"] < prev_low and latest["volume"] > vol_ma * self.vol_mult:
+        elif close < prev_low and volume > vol_ma * self.vol_mult:
             side = "SHORT"
-            entry = latest["close"]
+            entry = close
             sl = prev_high
             tp = entry - (sl - entry) * self.tp_ratio
 
         if side:
-            return {
-                "side": side,
-                "symbol": candle.get("symbol"),
-                "time": candle.get("time"),
-                "entry": float(entry),
-                "sl": float(round(sl, 4)),
-                "tp": float(round(tp, 4)),
-                "meta": {
-                    "setup_name": "Breakout (generic)",
-                },
-            }
+            self.signal_fired = True
+            return self._signal(side, entry, sl, tp, candle["symbol"], candle["time"])
 
         return None
+
+    def process_batch(self, open_arr, high_arr, low_arr, close_arr, vol_arr, ts_arr, symbol=None):
+        """Vectorized equivalent of calling on_candle for every candle in the batch.
+
+        Arrays are equal-length columns (oldest first). Returns the signals
+        in time order; afterwards the strategy state is the same as after the
+        scalar path, so streaming can continue with on_candle.
+        """
+        need = self._size
+        n0 = self._count
+        k = min(n0, need)
+        high = np.concatenate((self._last(self.highs, k), np.asarray(high_arr, dtype=np.float64)))
+        low = np.concatenate((self._last(self.lows, k), np.asarray(low_arr, dtype=np.float64)))
+        volume = np.concatenate((self._last(self.vols, k), np.asarray(vol_arr, dtype=np.float64)))
+
+        # carry the last `need` candles over into the ring buffer
+        tail = len(high) - min(len(high), need)
+        self.highs[:] = 0.0
+        self.lows[:] = 0.0
+        self.vols[:] = 0.0
+        m = len(high) - tail
+        self.highs[:m] = high[tail:]
+        self.lows[:m] = low[tail:]
+        self.vols[:m] = volume[tail:]
+        self._idx = m % need
+        self._count = n0 + len(high_arr)
+        self._vol_sum = float(volume[-self.vol_ma:].sum()) if self.vol_ma else 0.0
+
+        last_day = _session_date(ts_arr[-1]) if len(ts_arr) else self.session_date
+
+        # rolling over the vol_ma last candles of a lookback window: NaN if vol_ma > lookback
+        if self.vol_ma > self.lookback:
+            self._end_session_batch(last_day)
+            return []
+
+        prev_high = pd.Series(high).rolling(self.lookback).max().shift(1).to_numpy()
+        prev_low = pd.Series(low).rolling(self.lookback).min().shift(1).to_numpy()
+        vol_ma = pd.Series(volume).rolling(self.vol_ma).mean().shift(1).to_numpy()
+        close = np.concatenate((np.zeros(k), np.asarray(close_arr, dtype=np.float64)))
+
+        # candle j has n0 - k + j candles before it; on_candle needs `need`
+        ready = np.arange(len(high)) + (n0 - k) >= need
+        ready[:k] = False
+        vol_ok = volume > vol_ma * self.vol_mult
+        long_m = ready & vol_ok & (close > prev_high)
+        short_m = ready & vol_ok & ~long_m & (close < prev_low)
+
+        signals = []
+        for j in np.flatnonzero(long_m | short_m):
+            # one signal per session: dates only move forward, so checking
+            # the candidates alone gives the same result as every candle
+            day = _session_date(ts_arr[j - k])
+            if day != self.session_date:
+                self.session_date = day
+                self.signal_fired = False
+            if self.signal_fired:
+                continue
+            self.signal_fired = True
+            entry = close[j]
+            if long_m[j]:
+                side, sl = "LONG", prev_low[j]
+                tp = entry + (entry - sl) * self.tp_ratio
+            else:
+                side, sl = "SHORT", prev_high[j]
+                tp = entry - (sl - entry) * self.tp_ratio
+            signals.append(self._signal(side, entry, sl, tp, symbol, ts_arr[j - k]))
+        self._end_session_batch(last_day)
+        return signals
+
+    def _end_session_batch(self, last_day):
+        """Session state after a batch = as after on_candle for its last candle."""
+        if last_day != self.session_date:
+            self.session_date = last_day
+            self.signal_fired = False
+
+    def on_candles_batch(self, data):
+        """Backtest entry point: process_batch on a DataFrame / dict of columns.
+
+        Columns: time, open, high, low, close, volume (optional symbol),
+        oldest first. Returns the signals as a DataFrame, one row each.
+        """
+        symbol = np.asarray(data["symbol"], dtype=object)[0] if "symbol" in data and len(data["close"]) else None
+        signals = self.process_batch(
+            np.asarray(data["open"]), np.asarray(data["high"]), np.asarray(data["low"]),
+            np.asarray(data["close"]), np.asarray(data["volume"]),
+            np.asarray(data["time"], dtype=object), symbol=symbol)
+        return pd.DataFrame(signals, columns=["side", "symbol", "time", "entry", "sl", "tp", "meta"])
+
+    @staticmethod
+    def _signal(side, entry, sl, tp, symbol, ts):
+        return {
+            "side": side,
+            "symbol": symbol,
+            "time": ts,
+            "entry": float(entry),
+            "sl": float(round(sl, 4)),
+            "tp": float(round(tp, 4)),
+            "meta": {
+                "setup_name": "Breakout (generic)",
+            },
+        }
+
+
+def _session_date(ts):
+    """Session key of a candle time: the date part of the ISO string
+    (local date for offset timestamps), or .date() of a datetime."""
+    if isinstance(ts, str):
+        return ts[:10]
+    return None if ts is None else ts.date()
@@ -7,16 +7,27 @@ Access from any device on the same network (or server):
     http://<server-ip>:8501
 """
 
-import time
 import sys
 import os
 import datetime
 import zoneinfo
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # optioneel; zonder orjson gebruikt Plotly de stdlib json
+    orjson = None
+
+# Plotly serialiseert de figuur bij elke st.plotly_chart; met orjson gaan de
+# NumPy-kolommen van de chart rechtstreeks door de C-encoder
+if orjson is not None:
+    pio.json.config.default_engine = "orjson"
+
 # Ensure the app root is on sys.path so relative imports work
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -25,111 +36,256 @@ from turbo.translate import TurboTranslator, turbo_prijs
 from turbo.hl_tranche import render_hl_tranche_tab
 from turbo.box_strategy import fetch_box_levels, render_box_zone
 from rapport.dagrapport import render_dagrapport_tab_pc, render_dagrapport_tab_mobiel
+from ui.lw_chart import lw_chart
 
 
 # ---------------------------------------------------------------------------
 # Chart builder
 # ---------------------------------------------------------------------------
 
-def _build_chart(candles, entry_val, sl_val, tp_val, signals,
-                 turbo_sl=None, turbo_tp=None, turbo_entry=None):
-    """Plotly candlestick chart with SL/TP lines, turbo annotations, zoom buttons."""
+# "U32": ISO times with offset (yfinance, 25 chars) must not be truncated
+_OHLC_DTYPE = [("t", "U32"), ("o", "f8"), ("h", "f8"), ("l", "f8"), ("c", "f8")]
+
+
+@st.cache_data(ttl=10, max_entries=4)
+def _candles_to_arrays(n, last_time, _candles):
+    """OHLC columns of the candle history: (times, opens, highs, lows, closes).
+
+    Cached on (n, last_time) — the history is a rolling window, so this pair
+    only changes when a new candle arrives; `_candles` itself is not hashed.
+    Reruns in between reuse the converted arrays. One pass over the dicts
+    into a structured array, then each field as a contiguous column.
+    """
+    arr = np.fromiter(
+        ((c["time"], c["open"], c["high"], c["low"], c["close"]) for c in _candles),
+        dtype=_OHLC_DTYPE, count=n,
+    )
+    return tuple(np.ascontiguousarray(arr[f]) for f in ("t", "o", "h", "l", "c"))
+
+
+def _segments(times, y0, y1):
+    """Interleave (t, y0), (t, y1), gap per candle into flat x/y arrays."""
+    n = len(times)
+    x = np.empty(3 * n, dtype=object)
+    x[0::3] = times
+    x[1::3] = times
+    x[2::3] = None
+    y = np.empty(3 * n, dtype=np.float64)
+    y[0::3] = y0
+    y[1::3] = y1
+    y[2::3] = np.nan
+    return x, y
+
+
+def _candle_traces(times, opens, highs, lows, closes):
+    """Candles as WebGL line segments: per colour one wick and one body trace.
+
+    Scattergl draws all segments of a trace in one call instead of one SVG
+    node per candle (go.Candlestick). Only the body trace has a hover, with
+    the OHLC values carried in customdata.
+    """
+    up = closes >= opens
+    traces = []
+    for mask, color in ((up, "#26a69a"), (~up, "#ef5350")):
+        t = times[mask]
+        x, wick_y = _segments(t, lows[mask], highs[mask])
+        _, body_y = _segments(t, opens[mask], closes[mask])
+        ohlc = np.repeat(np.column_stack((opens[mask], highs[mask], lows[mask], closes[mask])), 3, axis=0)
+        traces.append(go.Scattergl(
+            x=x, y=wick_y, mode="lines", line=dict(color=color, width=1),
+            hoverinfo="skip", showlegend=False,
+        ))
+        traces.append(go.Scattergl(
+            x=x, y=body_y, mode="lines", line=dict(color=color, width=6),
+            name="ASML", showlegend=False, customdata=ohlc,
+            hovertemplate="O:%{customdata[0]:.2f} H:%{customdata[1]:.2f} "
+                          "L:%{customdata[2]:.2f} C:%{customdata[3]:.2f}<extra></extra>",
+        ))
+    return traces
+
+
+# Static chart layout (colours, axes, zoom buttons), built once at import;
+# go.Figure(layout=...) copies it, so the constant itself is never mutated
+_RANGESELECTOR_BUTTONS = (
+    dict(count=15, label="15m", step="minute", stepmode="backward"),
+    dict(count=30, label="30m", step="minute", stepmode="backward"),
+    dict(count=1,  label="1u",  step="hour",   stepmode="backward"),
+    dict(step="all", label="Alles"),
+)
+_LAYOUT = dict(
+    plot_bgcolor="#1a1f2e",
+    paper_bgcolor="#0e1117",
+    font=dict(color="#fafafa", size=11),
+    height=430,
+    margin=dict(l=10, r=190, t=40, b=10),
+    xaxis=dict(
+        gridcolor="#2a2f3e",
+        showgrid=True,
+        rangeslider=dict(visible=False),
+        rangeselector=dict(
+            buttons=list(_RANGESELECTOR_BUTTONS),
+            bgcolor="#1a2035",
+            activecolor="#00a6ed",
+            bordercolor="#2a2f3e",
+            font=dict(color="#fafafa", size=10),
+            x=0, y=1.04,
+        ),
+    ),
+    yaxis=dict(gridcolor="#2a2f3e", showgrid=True, tickformat="€.2f"),
+    hovermode="x unified",
+)
+
+
+def _signals_in(times, signals):
+    """Signals whose time is one of the candle `times` (sorted ascending).
+
+    Binary search (np.searchsorted) instead of a set of all candle times;
+    signals older than the first candle are skipped without a lookup.
+    """
+    if not len(times) or not signals:
+        return []
+    first = times[0]
+    sigs = [sig for sig in signals if str(sig.get("time", "")) >= first]
+    if not sigs:
+        return []
+    sig_times = np.array([str(sig["time"]) for sig in sigs])
+    idx = np.minimum(np.searchsorted(times, sig_times), len(times) - 1)
+    return [sig for sig, hit in zip(sigs, (times[idx] == sig_times).tolist()) if hit]
+
+
+def _build_chart(candles, signals):
+    """Plotly candlestick chart with signal markers and zoom buttons.
+
+    Only the data part: the Entry/SL/TP lines are set by `_set_levels()`,
+    so a cached figure can be reused while the candles do not change.
+    """
     if not candles:
         return None
 
-    times  = [c["time"] for c in candles]
-    opens  = [float(c["open"])  for c in candles]
-    highs  = [float(c["high"])  for c in candles]
-    lows   = [float(c["low"])   for c in candles]
-    closes = [float(c["close"]) for c in candles]
-
-    fig = go.Figure()
-
-    # --- Candlesticks ---
-    fig.add_trace(go.Candlestick(
-        x=times, open=opens, high=highs, low=lows, close=closes,
-        name="ASML",
-        increasing_line_color="#26a69a",
-        decreasing_line_color="#ef5350",
-        showlegend=False,
-    ))
-
-    # --- Signal markers (yellow triangle) ---
-    times_set = set(times)
-    for sig in signals[-10:]:
-        sig_time = sig.get("time", "")
-        if sig_time in times_set:
-            fig.add_trace(go.Scatter(
-                x=[sig_time],
-                y=[float(sig["entry"])],
-                mode="markers",
-                marker=dict(
-                    symbol="triangle-up" if sig.get("side") == "LONG" else "triangle-down",
-                    size=14, color="#ffd700",
-                    line=dict(color="#000000", width=1),
-                ),
-                showlegend=False,
-                hovertemplate=f"{sig.get('meta', {}).get('setup_name', '')} "
-                              f"{sig.get('side', '')} @ {sig['entry']:.2f}<extra></extra>",
-            ))
-
-    # --- Horizontal lines ---
-    def _hline(y, color, dash, label, turbo_txt=""):
-        fig.add_shape(
-            type="line", xref="paper", yref="y",
-            x0=0, x1=1, y0=y, y1=y,
-            line=dict(color=color, width=1.5, dash=dash),
-        )
-        fig.add_annotation(
-            x=1.01, xref="paper", y=y, yref="y",
-            text=f"{label}<br>€ {y:.2f}{turbo_txt}",
-            showarrow=False,
-            font=dict(color=color, size=10),
-            xanchor="left", align="left",
-            bgcolor="#0e1117", borderpad=2,
-        )
-
-    if entry_val is not None:
-        _hline(entry_val, "#4fa3e0", "solid", "Entry")
-
-    turbo_sl_txt = f"<br><b>Turbo SL € {turbo_sl:.2f}</b>" if turbo_sl is not None else ""
-    _hline(sl_val, "#ef5350", "dash", "SL", turbo_sl_txt)
-
-    turbo_tp_txt = f"<br><b>Turbo TP € {turbo_tp:.2f}</b>" if turbo_tp is not None else ""
-    _hline(tp_val, "#26a69a", "dash", "TP", turbo_tp_txt)
-
-    # --- Layout ---
-    fig.update_layout(
-        plot_bgcolor="#1a1f2e",
-        paper_bgcolor="#0e1117",
-        font=dict(color="#fafafa", size=11),
-        xaxis_rangeslider_visible=False,
-        height=430,
-        margin=dict(l=10, r=190, t=40, b=10),
-        xaxis=dict(
-            gridcolor="#2a2f3e",
-            showgrid=True,
-            rangeselector=dict(
-                buttons=[
-                    dict(count=15, label="15m", step="minute", stepmode="backward"),
-                    dict(count=30, label="30m", step="minute", stepmode="backward"),
-                    dict(count=1,  label="1u",  step="hour",   stepmode="backward"),
-                    dict(step="all", label="Alles"),
-                ],
-                bgcolor="#1a2035",
-                activecolor="#00a6ed",
-                bordercolor="#2a2f3e",
-                font=dict(color="#fafafa", size=10),
-                x=0, y=1.04,
+    times, opens, highs, lows, closes = _candles_to_arrays(
+        len(candles), candles[-1]["time"], candles)
+    sigs = _signals_in(times, signals[-10:])
+
+    fig = go.Figure(layout=_LAYOUT)
+
+    # --- Candlesticks (WebGL) ---
+    fig.add_traces(_candle_traces(times, opens, highs, lows, closes))
+
+    # --- Signal markers (yellow triangle) — one trace for all signals ---
+    if sigs:
+        fig.add_trace(go.Scattergl(
+            x=[sig["time"] for sig in sigs],
+            y=[float(sig["entry"]) for sig in sigs],
+            mode="markers",
+            marker=dict(
+                symbol=["triangle-up" if sig.get("side") == "LONG" else "triangle-down"
+                        for sig in sigs],
+                size=14, color="#ffd700",
+                line=dict(color="#000000", width=1),
             ),
-        ),
-        yaxis=dict(gridcolor="#2a2f3e", showgrid=True, tickformat="€.2f"),
-        hovermode="x unified",
-    )
+            showlegend=False,
+            hovertext=[f"{sig.get('meta', {}).get('setup_name', '')} "
+                       f"{sig.get('side', '')} @ {sig['entry']:.2f}" for sig in sigs],
+            hovertemplate="%{hovertext}<extra></extra>",
+        ))
 
     return fig
 
 
+# Level lines on the chart: (shape/annotation name, colour, dash, label)
+_LEVELS = (
+    ("entry", "#4fa3e0", "solid", "Entry"),
+    ("sl",    "#ef5350", "dash",  "SL"),
+    ("tp",    "#26a69a", "dash",  "TP"),
+)
+
+
+def _set_levels(fig, entry_val, sl_val, tp_val, turbo_sl=None, turbo_tp=None):
+    """Set the Entry/SL/TP lines and turbo annotations on `fig`.
+
+    The first call on a figure adds one named shape + annotation per level;
+    later calls (cached figure) only patch y/text/visible of those by name.
+    An Entry of None hides the entry line.
+    """
+    turbo_txt = {
+        "entry": "",
+        "sl": f"<br><b>Turbo SL € {turbo_sl:.2f}</b>" if turbo_sl is not None else "",
+        "tp": f"<br><b>Turbo TP € {turbo_tp:.2f}</b>" if turbo_tp is not None else "",
+    }
+    values = {"entry": entry_val, "sl": sl_val, "tp": tp_val}
+    first = not fig.layout.shapes
+
+    for name, color, dash, label in _LEVELS:
+        y = values[name]
+        visible = y is not None
+        text = f"{label}<br>€ {y:.2f}{turbo_txt[name]}" if visible else ""
+        if first:
+            fig.add_shape(
+                name=name, visible=visible,
+                type="line", xref="paper", yref="y",
+                x0=0, x1=1, y0=y or 0, y1=y or 0,
+                line=dict(color=color, width=1.5, dash=dash),
+            )
+            fig.add_annotation(
+                name=name, visible=visible,
+                x=1.01, xref="paper", y=y or 0, yref="y",
+                text=text,
+                showarrow=False,
+                font=dict(color=color, size=10),
+                xanchor="left", align="left",
+                bgcolor="#0e1117", borderpad=2,
+            )
+        elif visible:
+            fig.update_shapes(dict(y0=y, y1=y, visible=True), selector=dict(name=name))
+            fig.update_annotations(dict(y=y, text=text, visible=True), selector=dict(name=name))
+        else:
+            fig.update_shapes(visible=False, selector=dict(name=name))
+            fig.update_annotations(visible=False, selector=dict(name=name))
+
+
+@st.cache_resource
+def _translator():
+    """Shared TurboTranslator; it is stateless apart from the (empty) isin config."""
+    return TurboTranslator({})
+
+
+@st.cache_data(max_entries=16, persist="disk")
+def _signal_lines(sig_key, fin_long=0.0, rat_long=0.0, fin_short=0.0, rat_short=0.0):
+    """Caption lines for the compact signals list, newest first.
+
+    `sig_key` holds (side, time, entry, sl, tp) of the last signals; the
+    list only changes when a new signal arrives (or the turbo settings
+    change), so reruns hit the cache. With financing and ratio set for a
+    side, its lines also show the turbo SL/TP, computed for all rows in
+    one TurboTranslator.translate_batch call. Persisted to disk: the
+    signals are append-only, so after a restart the same keys hit again.
+    """
+    if not sig_key:
+        return []
+    df = pd.DataFrame.from_records(sig_key[::-1], columns=["side", "time", "entry", "sl", "tp"])
+    is_long = df["side"].to_numpy() == "LONG"
+    prices = df[["entry", "sl", "tp"]].to_numpy(dtype=np.float64)
+    levels = np.rint(prices).astype(np.int64)
+    icons = np.where(is_long, "🟢", "🔴")
+    times = df["time"].astype(str).str[:16].str.replace("T", " ", regex=False)
+
+    fin = np.where(is_long, fin_long, fin_short)
+    rat = np.where(is_long, rat_long, rat_short)
+    has_turbo = (fin > 0) & (rat > 0)
+    turbo = TurboTranslator.translate_batch(
+        df["side"].to_numpy(), prices[:, 0], prices[:, 1], prices[:, 2],
+        fin, np.where(has_turbo, rat, 1.0))
+    turbo_txt = [
+        f" &nbsp;· T:{t_sl:.2f}/{t_tp:.2f}" if ok else ""
+        for ok, t_sl, t_tp in zip(has_turbo.tolist(), turbo["turbo_sl_price"].tolist(),
+                                  turbo["turbo_tp_price"].tolist())
+    ]
+    return [
+        f"{icon} {t} &nbsp; E:{e} &nbsp;SL:{sl} &nbsp;TP:{tp}{tt}"
+        for icon, t, (e, sl, tp), tt in zip(icons, times, levels.tolist(), turbo_txt)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Box strategie helpers
 # ---------------------------------------------------------------------------
@@ -158,13 +314,13 @@ section[data-testid="stSidebar"] > div:first-child { padding-top: 0.5rem !import
 """, unsafe_allow_html=True)
 
 # ---------------------------------------------------------------------------
-# Engine singleton — lives in session_state so it survives Streamlit reruns
+# Engine singleton — st.cache_resource: één engine per proces, gedeeld door
+# alle browsersessies en reruns (één worker-thread, één feed)
 # ---------------------------------------------------------------------------
 
+@st.cache_resource
 def _get_engine() -> TradingEngine:
-    if "engine" not in st.session_state:
-        st.session_state["engine"] = TradingEngine()
-    return st.session_state["engine"]
+    return TradingEngine()
 
 
 engine = _get_engine()
@@ -311,43 +467,112 @@ with st.sidebar:
 # ---------------------------------------------------------------------------
 state = engine.get_state()
 
-# ---------------------------------------------------------------------------
-# Header — title + live price inline
-# ---------------------------------------------------------------------------
-status_icons = {"running": "🟢", "stopped": "⚫", "starting": "🟡", "error": "🔴"}
-icon = status_icons.get(state["status"], "⚫")
-
-col_hdr = st.columns([3, 2])
-with col_hdr[0]:
-    st.markdown("#### ASML Trading Monitor")
-    _feed_label = "live" if state.get("feed_mode") == "live" else "demo"
-    st.caption(
-        f"Status: {icon} {state['status'].upper()} &nbsp;|&nbsp; "
-        f"{state.get('ticker', 'ASML.AS')} [{_feed_label}] &nbsp;|&nbsp; "
-        f"Candles: {state['candle_count']} &nbsp;|&nbsp; "
-        f"Setup: {state['setup_name']}"
+# Live-blokken (header, chart) draaien als fragment: zolang de engine loopt
+# herladen alleen zij elke 3 s, niet het hele script met sidebar en tabs.
+_running_at_render = engine.is_running()
+_live_every = 3 if _running_at_render else None
+_last_signal_at_render = state["signals"][-1] if state["signals"] else None
+
+
+@st.fragment(run_every=_live_every)
+def _live_header():
+    state = engine.get_state()
+    # Start/stop of een nieuw signaal: volledige rerun (sidebar-knoppen,
+    # signalenlijst en defaults hangen daarvan af)
+    _last_sig = state["signals"][-1] if state["signals"] else None
+    if engine.is_running() != _running_at_render or _last_sig is not _last_signal_at_render:
+        st.rerun()
+
+    # -----------------------------------------------------------------------
+    # Header — title + live price inline
+    # -----------------------------------------------------------------------
+    status_icons = {"running": "🟢", "stopped": "⚫", "starting": "🟡", "error": "🔴"}
+    icon = status_icons.get(state["status"], "⚫")
+
+    col_hdr = st.columns([3, 2])
+    with col_hdr[0]:
+        st.markdown("#### ASML Trading Monitor")
+        _feed_label = "live" if state.get("feed_mode") == "live" else "demo"
+        st.caption(
+            f"Status: {icon} {state['status'].upper()} &nbsp;|&nbsp; "
+            f"{state.get('ticker', 'ASML.AS')} [{_feed_label}] &nbsp;|&nbsp; "
+            f"Candles: {state['candle_count']} &nbsp;|&nbsp; "
+            f"Setup: {state['setup_name']}"
+        )
+    with col_hdr[1]:
+        if state["current_price"] is not None:
+            price = state["current_price"]
+            pc    = state["prev_close"]
+            diff  = price - pc
+            diff_pct = (diff / pc) * 100 if pc else 0.0
+            sign = "+" if diff >= 0 else ""
+            color = "#26a69a" if diff >= 0 else "#ef5350"
+            st.markdown(
+                f"<span style='font-size:1.3rem; font-weight:700'>€ {price:,.2f}</span>"
+                f"&nbsp; <span style='color:{color}; font-size:0.85rem'>{sign}{diff:.2f} ({sign}{diff_pct:.2f}%)</span>",
+                unsafe_allow_html=True,
+            )
+            if state["current_candle"]:
+                c = state["current_candle"]
+                st.caption(f"O:{c['open']:.2f} H:{c['high']:.2f} L:{c['low']:.2f} Vol:{c['volume']}")
+        else:
+            st.caption("Wachten op data… Druk **Start** in de zijbalk.")
+
+    if state["error_msg"]:
+        st.error(f"Fout in trading engine: {state['error_msg']}")
+
+
+@st.fragment(run_every=_live_every)
+def _live_chart(entry_val, sl_val, tp_val, turbo_sl, turbo_tp):
+    """Candlestick chart; herlaadt als fragment met de niveaus van de laatste volledige run."""
+    state   = engine.get_state()
+    candles = state["candle_history"]
+    if engine.cfg.get("chart_engine") == "lightweight":
+        # De browser-component werkt zelf alleen de nieuwe candles bij
+        if candles:
+            lw_chart(
+                candles, entry_val, sl_val, tp_val,
+                signals=state["signals"],
+                series_id=f"{state['ticker']}|{state['feed_mode']}",
+                run_id=state["run_id"],
+                turbo_sl=turbo_sl, turbo_tp=turbo_tp,
+                key="main_lw_chart",
+            )
+        else:
+            st.info("Nog geen candle data. Druk **Start** in de zijbalk.")
+        return
+    # Figuur in session_state: traces alleen opnieuw opbouwen bij een nieuwe
+    # candle of een nieuw signaal; de niveaulijnen worden elke rerun gezet
+    _sigs = state["signals"]
+    _chart_key = (
+        len(candles), candles[-1]["time"] if candles else None,
+        len(_sigs), _sigs[-1].get("time") if _sigs else None,
     )
-with col_hdr[1]:
-    if state["current_price"] is not None:
-        price = state["current_price"]
-        pc    = state["prev_close"]
-        diff  = price - pc
-        diff_pct = (diff / pc) * 100 if pc else 0.0
-        sign = "+" if diff >= 0 else ""
-        color = "#26a69a" if diff >= 0 else "#ef5350"
-        st.markdown(
-            f"<span style='font-size:1.3rem; font-weight:700'>€ {price:,.2f}</span>"
-            f"&nbsp; <span style='color:{color}; font-size:0.85rem'>{sign}{diff:.2f} ({sign}{diff_pct:.2f}%)</span>",
-            unsafe_allow_html=True,
+    if st.session_state.get("chart_key") != _chart_key:
+        st.session_state["chart_fig"] = _build_chart(candles=candles, signals=_sigs)
+        st.session_state["chart_key"] = _chart_key
+        st.session_state.pop("chart_levels_key", None)
+    fig = st.session_state["chart_fig"]
+    if fig:
+        # Meestal verandert er niets tussen twee ticks: dan ook de niveaus niet patchen
+        _levels_key = (entry_val, sl_val, tp_val, turbo_sl, turbo_tp)
+        if st.session_state.get("chart_levels_key") != _levels_key:
+            _set_levels(fig, entry_val, sl_val, tp_val, turbo_sl=turbo_sl, turbo_tp=turbo_tp)
+            st.session_state["chart_levels_key"] = _levels_key
+        st.plotly_chart(
+            fig,
+            key="main_chart",
+            width="stretch",
+            config={
+                "editable": False,
+                "edits": {"shapePosition": True},
+            },
         )
-        if state["current_candle"]:
-            c = state["current_candle"]
-            st.caption(f"O:{c['open']:.2f} H:{c['high']:.2f} L:{c['low']:.2f} Vol:{c['volume']}")
     else:
-        st.caption("Wachten op data… Druk **Start** in de zijbalk.")
+        st.info("Nog geen candle data. Druk **Start** in de zijbalk.")
+
 
-if state["error_msg"]:
-    st.error(f"Fout in trading engine: {state['error_msg']}")
+_live_header()
 
 st.divider()
 
@@ -501,7 +726,6 @@ with _tab_monitor:
     # ---------------------------------------------------------------------------
     # Chart prep — compute defaults and bounds
     # ---------------------------------------------------------------------------
-    candles     = state["candle_history"]
     last_signal = state["signals"][-1] if state["signals"] else None
     cur_price   = state["current_price"] or float(state["prev_close"])
 
@@ -593,15 +817,13 @@ with _tab_monitor:
             if state["signals"]:
                 st.divider()
                 st.markdown("**Signalen**")
-                for s in reversed(state["signals"][-5:]):
-                    _s_icon = "🟢" if s.get("side") == "LONG" else "🔴"
-                    _s_t = str(s.get("time", ""))[:16].replace("T", " ")
-                    st.caption(
-                        f"{_s_icon} {_s_t} &nbsp; "
-                        f"E:{float(s['entry']):.0f} &nbsp;"
-                        f"SL:{float(s['sl']):.0f} &nbsp;"
-                        f"TP:{float(s['tp']):.0f}"
-                    )
+                _sig_key = tuple(
+                    (s.get("side"), s.get("time", ""), s["entry"], s["sl"], s["tp"])
+                    for s in state["signals"][-5:]
+                )
+                for _line in _signal_lines(_sig_key, float(financing_long), float(ratio_long),
+                                           float(financing_short), float(ratio_short)):
+                    st.caption(_line)
 
     # --- Right: Turbo Calculator — all values from main block + sidebar settings ---
     _calc_side        = default_side
@@ -636,7 +858,7 @@ with _tab_monitor:
                 "sl":    chart_sl,
                 "tp":    chart_tp,
             }
-            result = TurboTranslator({}).translate(
+            result = _translator().translate(
                 _dummy,
                 asml_price=chart_asml_entry,
                 financing=_calc_financing,
@@ -669,41 +891,15 @@ with _tab_monitor:
                 st.info("Geen berekening mogelijk — controleer leverage en ratio.")
 
     # ---------------------------------------------------------------------------
-    # Candlestick chart — full width, uses session_state turbo price for annotations
+    # Candlestick chart — full width, turbo annotations from the calculator result
     # ---------------------------------------------------------------------------
-    _prev_turbo_price = _calc_turbo_price
-    _prev_ratio       = _calc_ratio
-    _prev_side        = _calc_side
-
-    _dummy_chart = {"side": _prev_side, "entry": chart_asml_entry, "sl": chart_sl, "tp": chart_tp}
-    _result_chart = TurboTranslator({}).translate(
-        _dummy_chart,
-        asml_price=chart_asml_entry,
-        financing=_calc_financing,
-        ratio=_prev_ratio,
-    )
-
-    fig = _build_chart(
-        candles=candles,
+    _live_chart(
         entry_val=chart_asml_entry,
         sl_val=chart_sl,
         tp_val=chart_tp,
-        signals=state["signals"],
-        turbo_sl=_result_chart.get("turbo_sl_price"),
-        turbo_tp=_result_chart.get("turbo_tp_price"),
-        turbo_entry=_prev_turbo_price,
+        turbo_sl=turbo_sl_price,
+        turbo_tp=turbo_tp_price,
     )
-    if fig:
-        st.plotly_chart(
-            fig,
-            width="stretch",
-            config={
-                "editable": False,
-                "edits": {"shapePosition": True},
-            },
-        )
-    else:
-        st.info("Nog geen candle data. Druk **Start** in de zijbalk.")
 
 with _tab_tranche:
     render_hl_tranche_tab(
@@ -719,9 +915,3 @@ with _tab_rapport_pc:
 with _tab_rapport_mob:
     render_dagrapport_tab_mobiel()
 
-# ---------------------------------------------------------------------------
-# Auto-refresh when engine is running
-# ---------------------------------------------------------------------------
-if engine.is_running():
-    time.sleep(3)
-    st.rerun()
@@ -0,0 +1,58 @@
+"""Worker-thread van TradingEngine (backend/engine.py).
+
+Eén blijvende worker voert alle runs uit; een fout in de opbouw van een
+run mag die worker niet stoppen. Draaien: python -m unittest discover -s tests
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import backend.engine as engine
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class WorkerSurvivesSetupErrorTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        # cache niet in data/ van de repo schrijven
+        patcher = mock.patch.object(engine, "_CACHE_FILE", os.path.join(tmp.name, "cache.json"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.eng = engine.TradingEngine()
+        self.addCleanup(self._stop_engine)
+
+    def _stop_engine(self):
+        # de loopthread schrijft na stop() nog de finale cache; wachten, zodat
+        # dat nog binnen het gepatchte _CACHE_FILE gebeurt
+        self.eng.stop()
+        _wait_for(lambda: self.eng.get_state()["status"] != "running")
+
+    def test_error_in_build_strategy_keeps_worker_alive(self):
+        with mock.patch.object(engine.TradingEngine, "_build_strategy",
+                               side_effect=KeyError("setups")):
+            self.eng.start(feed_mode="mock")
+            self.assertTrue(_wait_for(lambda: self.eng.get_state()["status"] == "error"))
+        self.assertIn("setups", self.eng.get_state()["error_msg"])
+        self.assertTrue(self.eng._worker.is_alive())
+
+        # volgende start() op dezelfde worker draait gewoon
+        self.eng.start(feed_mode="mock")
+        self.assertTrue(_wait_for(lambda: self.eng.get_state()["candle_count"] > 0))
+        self.assertEqual(self.eng.get_state()["status"], "running")
+        self.assertIsNone(self.eng.get_state()["error_msg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+"""Test Signal-pad van ConfigUI (ui/gui.py) zonder display.
+
+De Tk-widgets zijn vervangen door kleine fakes; _EXECUTOR draait de job
+synchroon, zodat run_test -> worker -> _drain_test_result_q in één test
+doorlopen wordt. Draaien: python -m unittest discover -s tests
+"""
+
+import os
+import queue
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import ui.gui as gui
+
+
+class _Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _Widget:
+    """Fake dialoog/progressbar: registreert start/stop, bestaat altijd."""
+
+    def __init__(self):
+        self.calls = []
+
+    def winfo_exists(self):
+        return True
+
+    def start(self, *args):
+        self.calls.append("start")
+
+    def stop(self):
+        self.calls.append("stop")
+
+
+class _Window:
+    def __init__(self):
+        self.after_calls = []
+
+    def after(self, ms, func):
+        self.after_calls.append((ms, func))
+
+
+class _SyncExecutor:
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class _StubTranslator:
+    """Zelfde signatuur als TurboTranslator.translate(); onthoudt de aanroep."""
+
+    calls = []
+
+    def __init__(self, cfg=None):
+        pass
+
+    def translate(self, signal, asml_price=None, financing=None, ratio=None):
+        self.calls.append({"signal": signal, "asml_price": asml_price,
+                           "financing": financing, "ratio": ratio})
+        return {"financing": financing, "leverage": 3.43, "ratio": float(ratio),
+                "turbo_entry_price": 3.50, "turbo_sl_price": 3.40, "turbo_tp_price": 3.80}
+
+
+def _config_ui(ws_path, translator=_StubTranslator):
+    """ConfigUI zonder __init__ (geen tk.Tk()), met de attributen van run_test."""
+    ui = gui.ConfigUI.__new__(gui.ConfigUI)
+    ui.config_dict = {"atr_buffer_k": 0.30, "atr_min_buffer": 0.20}
+    ui.leverage, ui.turbo_entry, ui.ratio = 3.50, 3.50, 100
+    ui.leverage_var = _Var("3.50")
+    ui.turbo_entry_var = _Var("3.50")
+    ui.ratio_var = _Var("100")
+    ui._TurboTranslator = translator
+    ui._test_result_q = queue.Queue()
+    ui._test_pending = 0
+    ui._ws_path = ws_path
+    ui.window = _Window()
+    return ui
+
+
+def run_test_signal(ui, side="LONG", asml="1200.00", sl="1190.00", tp="1230.00"):
+    """Klik Run Test en laat de (synchrone) worker + drain lopen.
+
+    Geeft (messagebox-mock, dialoog, progressbar) terug.
+    """
+    dlg, progress = _Widget(), _Widget()
+    with mock.patch.object(gui, "_EXECUTOR", _SyncExecutor()), \
+            mock.patch.object(gui, "_busy"), \
+            mock.patch.object(gui, "messagebox") as mbox:
+        ui._run_test(dlg, progress, _Var(side), _Var(asml), _Var(sl), _Var(tp))
+        mbox.showerror.assert_not_called()
+        ui._drain_test_result_q()
+    return mbox, dlg, progress
+
+
+class RunTestTranslateTest(unittest.TestCase):
+    def setUp(self):
+        _StubTranslator.calls = []
+
+    def test_translate_called_with_financing_from_turbo_price(self):
+        ui = _config_ui("/nonexistent/ws.xlsx")
+        mbox, dlg, progress = run_test_signal(ui)
+
+        self.assertEqual(len(_StubTranslator.calls), 1)
+        call = _StubTranslator.calls[0]
+        self.assertEqual(call["asml_price"], 1200.0)
+        self.assertEqual(call["ratio"], 100)
+        # turboprijs 3.50 x ratio 100 onder de ASML-prijs (LONG)
+        self.assertAlmostEqual(call["financing"], 850.0)
+
+        self.assertEqual(ui.window.after_calls[0][0], 80)
+        self.assertEqual(ui._test_pending, 0)
+        self.assertEqual(progress.calls, ["start", "stop"])
+        mbox.showinfo.assert_called_once()
+        msg = mbox.showinfo.call_args[0][1]
+        self.assertIn("Turbo Entry: 3.50", msg)
+        self.assertIn("Turbo SL: 3.40", msg)
+        self.assertIn("Leverage: 3.43", msg)
+        self.assertNotIn("ATR", msg)  # geen workspace-bestand
+
+    def test_real_translator_round_trip(self):
+        from turbo.translate import TurboTranslator
+
+        ui = _config_ui("/nonexistent/ws.xlsx", translator=TurboTranslator)
+        mbox, _, _ = run_test_signal(ui, side="SHORT", sl="1210.00", tp="1180.00")
+        msg = mbox.showinfo.call_args[0][1]
+        # zelfde turboprijs terug bij de ASML-prijs waaruit financing is afgeleid
+        self.assertIn("Turbo Entry: 3.50", msg)
+        self.assertIn("Turbo SL: 3.40", msg)
+        self.assertIn("Turbo TP: 3.70", msg)
+
+    def test_translator_error_key_is_shown(self):
+        class _NoFinancing(_StubTranslator):
+            def translate(self, signal, asml_price=None, financing=None, ratio=None):
+                return {"error": "financing, ratio of asml_price ontbreekt"}
+
+        ui = _config_ui("/nonexistent/ws.xlsx", translator=_NoFinancing)
+        mbox, _, _ = run_test_signal(ui)
+        self.assertEqual(mbox.showinfo.call_args[0][1], "Turbo: financing, ratio of asml_price ontbreekt")
+
+
+def _write_workbook(path, n=300, seed=1):
+    """OHLCV-werkblad zoals de workspace-export: kopregels, dan time/close/high/low/open/volume."""
+    rng = np.random.default_rng(seed)
+    close = 1200 + rng.normal(0, 1, n).cumsum()
+    high = close + rng.random(n)
+    low = close - rng.random(n)
+    opn = close + rng.normal(0, 0.2, n)
+    rows = [["ASML 5-min", None, None, None, None, None],
+            [1209.5, "1209.5", None, None, None, None]]  # getallen zijn geen datum
+    times = pd.date_range("2026-02-02 09:00", periods=n, freq="5min").astype(str)
+    rows += [[t, c, h, lo, o, 100] for t, c, h, lo, o in zip(times, close, high, low, opn)]
+    pd.DataFrame(rows, columns=["Datum", "Slot", "Hoog", "Laag", "Open", "Volume"]).to_excel(path, index=False)
+    return high, low, close
+
+
+def _reference_atr(highs, lows, closes, period=14):
+    """ATR zoals de oorspronkelijke Python-lus in run_test."""
+    trs = [max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+           for i in range(1, len(closes))]
+    atr = sum(trs[:period]) / period
+    for tr in trs[period:]:
+        atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+class RunTestWorkbookTest(unittest.TestCase):
+    """Volledig pad met een echt xlsx: inlezen, kopregeldetectie, ATR, caches."""
+
+    def setUp(self):
+        gui._compute_atr_cached.cache_clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "ws.xlsx")
+        self.highs, self.lows, self.closes = _write_workbook(self.path)
+
+    def test_atr_and_buffer_in_result(self):
+        ui = _config_ui(self.path)
+        mbox, _, _ = run_test_signal(ui)
+        atr = round(_reference_atr(self.highs, self.lows, self.closes), 6)
+        buffer = max(0.20, round(0.30 * atr, 4))
+        msg = mbox.showinfo.call_args[0][1]
+        self.assertIn(f"ATR(14) [5-min]: {atr:.4f}", msg)
+        self.assertIn(f"Suggested SL buffer: {buffer:.4f} (k=0.3, min=0.2)", msg)
+        self.assertEqual(gui._workspace_atr(self.path, 0.30, 0.20), (atr, buffer))
+
+    def test_repeat_click_hits_cache_until_file_changes(self):
+        ui = _config_ui(self.path)
+        run_test_signal(ui)
+        run_test_signal(ui)
+        info = gui._compute_atr_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+        mtime = os.path.getmtime(self.path)
+        os.utime(self.path, (mtime + 10, mtime + 10))
+        run_test_signal(ui)
+        self.assertEqual(gui._compute_atr_cached.cache_info().misses, 2)
+
+    def test_feather_cache_matches_xlsx(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("pyarrow niet geïnstalleerd: geen Feather-cache")
+        first = gui._read_workspace_df(self.path)
+        self.assertTrue(os.path.exists(self.path + ".feather"))
+        second = gui._read_workspace_df(self.path)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_missing_file_gives_no_atr(self):
+        self.assertEqual(gui._workspace_atr(os.path.join(self.tmp.name, "nope.xlsx"), 0.30, 0.20),
+                         (None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Numba-kern voor TurboTranslator.translate().
+
+Alleen de rekenkern: leverage en de turbo-prijzen voor entry/SL/TP,
+onafgerond. Afronden gebeurt in turbo/translate.py met Python's round(),
+zodat de uitkomst bit-voor-bit gelijk blijft aan de oude berekening (geen
+fastmath om dezelfde reden). Zonder numba is `njit` een no-op (zie
+_njit.py) en draait dezelfde functie als gewone Python.
+"""
+
+from _njit import njit
+
+
+@njit(cache=True)
+def translate_core(is_long, entry, sl, tp, asml_price, financing, ratio):
+    """(leverage, turbo_entry, turbo_sl, turbo_tp) voor één signaal."""
+    if is_long:
+        intrinsic = asml_price - financing
+        turbo_entry = (entry - financing) / ratio
+        turbo_sl = (sl - financing) / ratio
+        turbo_tp = (tp - financing) / ratio
+    else:
+        intrinsic = financing - asml_price
+        turbo_entry = (financing - entry) / ratio
+        turbo_sl = (financing - sl) / ratio
+        turbo_tp = (financing - tp) / ratio
+    leverage = asml_price / intrinsic if intrinsic > 0 else 0.0
+    return leverage, turbo_entry, turbo_sl, turbo_tp
@@ -1,3 +1,10 @@
+import functools
+
+import numpy as np
+
+from turbo._translate_njit import translate_core
+
+
 def turbo_prijs(asml_prijs: float, financiering: float, ratio: float, side: str) -> float:
     """Bereken turbo prijs voor één ASML-niveau.
 
@@ -11,6 +18,31 @@ def turbo_prijs(asml_prijs: float, financiering: float, ratio: float, side: str)
     return round((financiering - asml_prijs) / ratio, 2)
 
 
+def financiering_bij_turbo_prijs(asml_prijs: float, prijs: float, ratio: float, side: str) -> float:
+    """Financieringsniveau waarbij de turbo bij `asml_prijs` `prijs` kost.
+
+    Inverse van turbo_prijs(): voor invoer die een turboprijs + ratio kent maar
+    geen financieringsniveau (CLI, tkinter-GUI).
+    """
+    if side == "LONG":
+        return asml_prijs - prijs * ratio
+    return asml_prijs + prijs * ratio
+
+
+@functools.lru_cache(maxsize=32)
+def _translate_core(is_long, entry, sl, tp, asml_price, financing, ratio):
+    """Arithmetic of translate(): (leverage, turbo_entry, turbo_sl, turbo_tp), rounded.
+
+    The kernel itself is numba-compiled when available (turbo/_translate_njit.py).
+    Memoized: the UI calls translate() with the same inputs on every rerun
+    (calculator and chart), so repeated calls are a dict lookup.
+    """
+    leverage, turbo_entry, turbo_sl, turbo_tp = translate_core(
+        is_long, entry, sl, tp, asml_price, financing, ratio)
+    return (round(leverage, 2), round(turbo_entry, 2),
+            round(turbo_sl, 2), round(turbo_tp, 2))
+
+
 class TurboTranslator:
     """Translate ASML SL/TP levels to turbo prices using financing level and ratio.
 
@@ -59,25 +91,45 @@ class TurboTranslator:
         ratio      = float(ratio)
         asml_price = float(asml_price)
 
-        if side == "LONG":
-            intrinsic  = asml_price - financing
-            leverage   = asml_price / intrinsic if intrinsic > 0 else 0.0
-            turbo_entry = (entry - financing) / ratio
-            turbo_sl    = (sl    - financing) / ratio
-            turbo_tp    = (tp    - financing) / ratio
-        else:
-            intrinsic  = financing - asml_price
-            leverage   = asml_price / intrinsic if intrinsic > 0 else 0.0
-            turbo_entry = (financing - entry) / ratio
-            turbo_sl    = (financing - sl)    / ratio
-            turbo_tp    = (financing - tp)    / ratio
+        leverage, turbo_entry, turbo_sl, turbo_tp = _translate_core(
+            side == "LONG", entry, sl, tp, asml_price, financing, ratio)
 
         result.update({
             "financing":         round(financing, 2),
-            "leverage":          round(leverage, 2),
+            "leverage":          leverage,
             "ratio":             ratio,
-            "turbo_entry_price": round(turbo_entry, 2),
-            "turbo_sl_price":    round(turbo_sl,    2),
-            "turbo_tp_price":    round(turbo_tp,    2),
+            "turbo_entry_price": turbo_entry,
+            "turbo_sl_price":    turbo_sl,
+            "turbo_tp_price":    turbo_tp,
         })
         return result
+
+    @staticmethod
+    def translate_batch(side, entry, sl, tp, financing, ratio, asml_price=None):
+        """Vectorized translate() for many signals at once.
+
+        Args are equal-length arrays (side as "LONG"/"SHORT" strings; financing
+        and ratio may also be scalars). asml_price defaults to entry.
+        Returns a dict of arrays: leverage, turbo_entry_price, turbo_sl_price,
+        turbo_tp_price — the same values as translate() per signal, computed
+        branch-free with np.where on the side mask.
+        """
+        is_long    = np.asarray(side) == "LONG"
+        entry      = np.asarray(entry, dtype=np.float64)
+        sl         = np.asarray(sl, dtype=np.float64)
+        tp         = np.asarray(tp, dtype=np.float64)
+        financing  = np.asarray(financing, dtype=np.float64)
+        ratio      = np.asarray(ratio, dtype=np.float64)
+        asml_price = entry if asml_price is None else np.asarray(asml_price, dtype=np.float64)
+
+        # (x - financing) for LONG, (financing - x) for SHORT
+        sign = np.where(is_long, 1.0, -1.0)
+        intrinsic = sign * (asml_price - financing)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            leverage = np.where(intrinsic > 0, asml_price / intrinsic, 0.0)
+        return {
+            "leverage":          np.round(leverage, 2),
+            "turbo_entry_price": np.round(sign * (entry - financing) / ratio, 2),
+            "turbo_sl_price":    np.round(sign * (sl - financing) / ratio, 2),
+            "turbo_tp_price":    np.round(sign * (tp - financing) / ratio, 2),
+        }
@@ -1,7 +1,143 @@
 """Simple tkinter GUI for local testing of ASML trading app."""
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+import collections
+import functools
+import os
 import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# pandas is only needed for the Test Signal ATR; imported on first use
+# (see _get_pd) so GUI start-up does not pay for it
+_pd = None
+
+
+def _get_pd():
+    global _pd
+    if _pd is None:
+        import pandas as _pd
+    return _pd
+
+# Worker threads for slow work started from Tk callbacks (Excel read + ATR).
+# Tk itself is single-threaded: workers never touch widgets, they put their
+# result on a queue that the Tk thread drains via window.after().
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
+def _read_workspace_df(path):
+    """Raw first sheet of the workspace Excel file as a DataFrame.
+
+    Reads the Feather copy next to the workbook (path + ".feather") when it
+    is at least as new as the workbook; otherwise parses the xlsx and writes
+    that copy for the next launch. Feather needs pyarrow: without it (or for
+    a sheet Arrow cannot store) every call parses the xlsx.
+    """
+    pd = _get_pd()
+    cache = path + ".feather"
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(path):
+            return pd.read_feather(cache)
+    except Exception:
+        pass  # no (usable) cache
+    # Excel engine choice (calamine, openpyxl fallback) lives in _open_excel
+    from strategies.asml_setups import _open_excel
+    with _open_excel(path) as xl:
+        df = xl.parse(0)
+    # Feather wants string column names; the columns are used by position
+    df.columns = [str(c) for c in df.columns]
+    try:
+        df.to_feather(cache)
+    except Exception:
+        pass
+    return df
+
+
+@functools.lru_cache(maxsize=4)
+def _compute_atr_cached(path, mtime, k, min_floor):
+    """ATR(14) and suggested SL buffer for the Excel file at `path`.
+
+    Memoized per (path, mtime, k, min_floor): the workbook is static during a
+    session, so repeated Test Signal clicks do not parse it again, while
+    saving the file (new mtime) invalidates the entry. Errors propagate and
+    are therefore not cached. Returns (atr_value, suggested_buffer).
+    """
+    pd = _get_pd()
+    atr_value = None
+    suggested_buffer = None
+    df = _read_workspace_df(path)
+    # find first row with datetime-like in first column: only cells whose
+    # text has a digit and a "-" or ":" count (so numbers such as "1209.5"
+    # are never taken for dates), then the whole column is parsed at once
+    # ("mixed" = per cell, the header rows differ from the data)
+    first_col = df.iloc[:, 0]
+    text = first_col.astype(str)
+    datelike = first_col.notna() & text.str.contains(r"\d") & text.str.contains(r"[-:]")
+    parsed = pd.to_datetime(text.where(datelike), format='mixed', utc=True, errors='coerce')
+    start_idx = parsed.first_valid_index()
+    if start_idx is not None:
+        data = df.loc[start_idx:].copy()
+        cols = list(data.columns)
+        # map: time, close, high, low, open, volume
+        data = data.rename(columns={
+            cols[0]: 'time', cols[1]: 'close', cols[2]: 'high', cols[3]: 'low', cols[4]: 'open', cols[5]: 'volume'
+        })
+        data['time'] = parsed.loc[start_idx:]
+        ohlc = ['open','high','low','close']
+        data[ohlc] = data[ohlc].apply(pd.to_numeric, errors='coerce')
+        data = data.dropna(subset=['time','open','high','low','close'])
+        # TR + Wilder smoothing fused in one pass (numba kernel, NumPy
+        # fallback); imported here so numba loads/compiles in the worker
+        from strategies._kernels import wilder_atr
+        highs = np.ascontiguousarray(data['high'].to_numpy(dtype=np.float64))
+        lows = np.ascontiguousarray(data['low'].to_numpy(dtype=np.float64))
+        closes = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
+        atr = float(wilder_atr(highs, lows, closes, 14))
+        if not np.isnan(atr):
+            atr_value = round(atr, 6)
+            suggested_buffer = max(min_floor, round(k * atr_value, 4))
+    return atr_value, suggested_buffer
+
+
+def _workspace_atr(ws_path, k, min_floor):
+    """Compute ATR(14) and a suggested SL buffer from the workspace Excel file.
+
+    Runs on _EXECUTOR, off the Tk thread. Returns (atr_value, suggested_buffer),
+    both None when the file is missing or cannot be parsed.
+    """
+    try:
+        # one stat: getmtime raises OSError if the file does not exist
+        return _compute_atr_cached(ws_path, os.path.getmtime(ws_path), k, min_floor)
+    except Exception:
+        return None, None
+
+
+def _busy(widget, hold):
+    """tk busy hold/forget on `widget`: blocks its input, shows a watch cursor.
+
+    One Tk call instead of disabling every child widget; a no-op on Tk < 8.6.
+    """
+    try:
+        if hold:
+            widget.tk.call("tk", "busy", "hold", widget._w, "-cursor", "watch")
+        else:
+            widget.tk.call("tk", "busy", "forget", widget._w)
+    except tk.TclError:
+        pass
+
+
+# Numeric Entry fields: digits with at most two decimals; partial input
+# ("", "3.") must pass too, the value is only parsed at submit time
+_PRICE_RE = re.compile(r"\d{0,4}(\.\d{0,2})?")
+
+
+def _is_price_input(proposed):
+    """validatecommand check (%P = the field text after the keystroke)."""
+    return _PRICE_RE.fullmatch(proposed) is not None
 
 
 class ConfigUI:
@@ -18,6 +154,14 @@ class ConfigUI:
         self.ratio = config_dict.get("turbo", {}).get("ratio", 100)
         self.setup = config_dict.get("demo_setup", "morning_gap")
         self.result = None  # will be set when user clicks "Start"
+        # Test Signal results from _EXECUTOR workers, drained on the Tk thread
+        self._test_result_q = queue.Queue()
+        self._test_pending = 0
+        # workspace Excel file for the Test Signal ATR (known filename in cwd)
+        self._ws_path = os.path.join(os.getcwd(), "ASML_OHLCL_2_tm_13_FEB_2026.xlsx")
+        # filled by _warm_imports (background thread) for run_test
+        self._TurboTranslator = None
+        threading.Thread(target=self._warm_imports, daemon=True).start()
 
         self.window = tk.Tk()
         self.window.title("ASML Trading App - Config")
@@ -25,10 +169,25 @@ class ConfigUI:
         self.window.geometry("780x560")
         self.build_ui()
 
+    def _warm_imports(self):
+        """Import the translator and pandas off the Tk thread at start-up.
+
+        So the first Test Signal click does not pay the import cost; run_test
+        falls back to a regular import when this has not finished yet.
+        """
+        try:
+            from turbo.translate import TurboTranslator
+            _get_pd()
+        except Exception:
+            return
+        self._TurboTranslator = TurboTranslator
+
     def build_ui(self):
         """Build the GUI layout."""
         frame = ttk.Frame(self.window, padding=20)
         frame.pack(fill=tk.BOTH, expand=True)
+        # key validation for the numeric fields (also used by the Test Signal dialog)
+        self._vcmd = (self.window.register(_is_price_input), "%P")
 
         # Title
         title = ttk.Label(frame, text="ASML Trading Setup", font=("Arial", 14, "bold"))
@@ -49,14 +208,16 @@ class ConfigUI:
 
         # Turbo Leverage
         ttk.Label(frame, text="Turbo Leverage (3.00 - 4.00):").pack(anchor=tk.W, pady=(10, 5))
-        self.leverage_var = tk.DoubleVar(value=self.leverage)
-        leverage_entry = ttk.Entry(frame, textvariable=self.leverage_var, width=15)
+        self.leverage_var = tk.StringVar(value=f"{self.leverage:.2f}")
+        leverage_entry = ttk.Entry(frame, textvariable=self.leverage_var, width=15,
+                                   validate="key", validatecommand=self._vcmd)
         leverage_entry.pack(anchor=tk.W, pady=(0, 15))
 
         # Turbo Entry Price
         ttk.Label(frame, text="Turbo Price (two decimals):").pack(anchor=tk.W, pady=(10, 5))
-        self.turbo_entry_var = tk.DoubleVar(value=self.turbo_entry)
-        turbo_entry_field = ttk.Entry(frame, textvariable=self.turbo_entry_var, width=15)
+        self.turbo_entry_var = tk.StringVar(value=f"{self.turbo_entry:.2f}")
+        turbo_entry_field = ttk.Entry(frame, textvariable=self.turbo_entry_var, width=15,
+                                      validate="key", validatecommand=self._vcmd)
         turbo_entry_field.pack(anchor=tk.W, pady=(0, 20))
 
         # Buttons
@@ -77,12 +238,12 @@ class ConfigUI:
     def on_start(self):
         """Validate and start the app."""
         try:
-            lev = self.leverage_var.get()
+            lev = float(self.leverage_var.get())
             if not (3.00 <= lev <= 4.00):
                 messagebox.showerror("Invalid Leverage", "Leverage must be between 3.00 and 4.00.")
                 return
 
-            entry = self.turbo_entry_var.get()
+            entry = float(self.turbo_entry_var.get())
             if entry <= 0:
                 messagebox.showerror("Invalid Price", "Entry price must be positive.")
                 return
@@ -103,7 +264,7 @@ class ConfigUI:
                 "setup": self.setup_var.get(),
             }
             self.window.quit()
-        except tk.TclError as e:
+        except (tk.TclError, ValueError) as e:
             messagebox.showerror("Input Error", f"Invalid input: {e}")
 
     def on_cancel(self):
@@ -111,11 +272,23 @@ class ConfigUI:
         self.window.quit()
 
     def show(self):
-        """Show the GUI and return the result (or None if canceled)."""
+        """Show the GUI and return the result (or None if canceled).
+
+        The window is only withdrawn: it stays the Tk root, so StatusWindow
+        can open as its Toplevel (one Tcl interpreter per process). Call
+        destroy() when done.
+        """
         self.window.mainloop()
-        self.window.destroy()
+        self.window.withdraw()
         return self.result
 
+    def destroy(self):
+        """Destroy the (withdrawn) root window."""
+        try:
+            self.window.destroy()
+        except Exception:
+            pass
+
     def on_test_signal(self):
         """Open a dialog to input ASML price/SL/TP and display translated turbo values."""
         try:
@@ -134,118 +307,26 @@ class ConfigUI:
 
             # ASML price
             ttk.Label(frame, text="ASML Price:").grid(row=1, column=0, sticky=tk.W)
-            asml_var = tk.DoubleVar(value=self.config_dict.get("demo_prev_close", 1209.0))
-            asml_entry = ttk.Entry(frame, textvariable=asml_var)
+            asml_default = float(self.config_dict.get("demo_prev_close", 1209.0))
+            asml_var = tk.StringVar(value=f"{asml_default:.2f}")
+            asml_entry = ttk.Entry(frame, textvariable=asml_var, validate="key", validatecommand=self._vcmd)
             asml_entry.grid(row=1, column=1, sticky=tk.W)
 
             # SL
             ttk.Label(frame, text="SL:").grid(row=2, column=0, sticky=tk.W)
-            sl_var = tk.DoubleVar(value=round(asml_var.get() - 9.0, 2))
-            sl_entry = ttk.Entry(frame, textvariable=sl_var)
+            sl_var = tk.StringVar(value=f"{asml_default - 9.0:.2f}")
+            sl_entry = ttk.Entry(frame, textvariable=sl_var, validate="key", validatecommand=self._vcmd)
             sl_entry.grid(row=2, column=1, sticky=tk.W)
 
             # TP
             ttk.Label(frame, text="TP:").grid(row=3, column=0, sticky=tk.W)
-            tp_var = tk.DoubleVar(value=round(asml_var.get() + 26.0, 2))
-            tp_entry = ttk.Entry(frame, textvariable=tp_var)
+            tp_var = tk.StringVar(value=f"{asml_default + 26.0:.2f}")
+            tp_entry = ttk.Entry(frame, textvariable=tp_var, validate="key", validatecommand=self._vcmd)
             tp_entry.grid(row=3, column=1, sticky=tk.W)
 
             # Run button
             def run_test():
-                try:
-                    side = side_var.get()
-                    asml = float(asml_var.get())
-                    sl = float(sl_var.get())
-                    tp = float(tp_var.get())
-                    # Gather current GUI inputs for turbo price / ratio / leverage
-                    try:
-                        lev = float(self.leverage_var.get())
-                    except Exception:
-                        lev = self.leverage
-                    try:
-                        turbo_price = float(self.turbo_entry_var.get())
-                    except Exception:
-                        turbo_price = self.turbo_entry
-                    try:
-                        ratio = int(self.ratio_var.get())
-                    except Exception:
-                        ratio = int(self.ratio)
-
-                    # Lazy import translator to avoid circular deps
-                    from turbo.translate import TurboTranslator
-                    from strategies.asml_setups import MorningGapFill
-
-                    t = TurboTranslator({"leverage": lev})
-                    signal = {"side": side, "entry": asml, "sl": sl, "tp": tp}
-                    res = t.translate(signal, asml_price=asml, turbo_price=turbo_price, ratio=ratio)
-
-                    # Attempt to compute ATR from workspace Excel file if present
-                    atr_value = None
-                    suggested_buffer = None
-                    # parameters for buffer: k and min_floor
-                    k = self.config_dict.get("atr_buffer_k", 0.30)
-                    min_floor = self.config_dict.get("atr_min_buffer", 0.20)
-                    # look for the known filename in workspace
-                    import os, pandas as _pd
-                    ws_path = os.path.join(os.getcwd(), "ASML_OHLCL_2_tm_13_FEB_2026.xlsx")
-                    try:
-                        if os.path.exists(ws_path):
-                            df = _pd.read_excel(ws_path, engine='openpyxl')
-                            # find first row with datetime-like in first column
-                            start_idx = None
-                            for i, v in enumerate(df.iloc[:, 0].values):
-                                if _pd.notna(v):
-                                    s = str(v)
-                                    if any(ch.isdigit() for ch in s) and ("-" in s or ":" in s):
-                                        start_idx = i
-                                        break
-                            if start_idx is not None:
-                                data = df.iloc[start_idx:].copy()
-                                cols = list(data.columns)
-                                # map: time, close, high, low, open, volume
-                                data = data.rename(columns={
-                                    cols[0]: 'time', cols[1]: 'close', cols[2]: 'high', cols[3]: 'low', cols[4]: 'open', cols[5]: 'volume'
-                                })
-                                data['time'] = _pd.to_datetime(data['time'], utc=True, errors='coerce')
-                                for c in ['open','high','low','close']:
-                                    data[c] = _pd.to_numeric(data[c], errors='coerce')
-                                data = data.dropna(subset=['time','open','high','low','close'])
-                                # compute TRs
-                                highs = data['high'].values
-                                lows = data['low'].values
-                                closes = data['close'].values
-                                trs = []
-                                for i in range(1, len(closes)):
-                                    tr = max(highs[i] - lows[i], abs(highs[i] - closes[i-1]), abs(lows[i] - closes[i-1]))
-                                    trs.append(tr)
-                                if len(trs) >= 14:
-                                    atr = sum(trs[:14]) / 14.0
-                                    for tr in trs[14:]:
-                                        atr = (atr * (14 - 1) + tr) / 14.0
-                                    atr_value = round(atr, 6)
-                                    suggested_buffer = max(min_floor, round(k * atr_value, 4))
-                    except Exception:
-                        atr_value = None
-
-                    # Format message with turbo translation and ATR/buffer if available
-                    parts = []
-                    if res.get("turbo_sl_price") is not None and res.get("turbo_tp_price") is not None:
-                        parts.append(f"Turbo Entry: {res.get('turbo_price'):.2f}")
-                        parts.append(f"Turbo SL: {res.get('turbo_sl_price'):.2f}")
-                        parts.append(f"Turbo TP: {res.get('turbo_tp_price'):.2f}")
-                        parts.append(f"Financing: {res.get('financing')}")
-                        parts.append(f"Ratio: {res.get('ratio')}")
-                    else:
-                        parts.append(f"Turbo distances: SL {res.get('turbo_sl_distance')}, TP {res.get('turbo_tp_distance')}")
-
-                    if atr_value is not None:
-                        parts.append(f"ATR(14) [5-min]: {atr_value:.4f}")
-                    if suggested_buffer is not None:
-                        parts.append(f"Suggested SL buffer: {suggested_buffer:.4f} (k={k}, min={min_floor})")
-
-                    messagebox.showinfo("Test Result", "\n".join(parts), parent=dlg)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to run test: {e}", parent=dlg)
+                self._run_test(dlg, progress, side_var, asml_var, sl_var, tp_var)
 
             run_btn = ttk.Button(frame, text="Run Test", command=run_test)
             run_btn.grid(row=4, column=0, pady=(10, 0))
@@ -253,6 +334,10 @@ class ConfigUI:
             close_btn = ttk.Button(frame, text="Close", command=dlg.destroy)
             close_btn.grid(row=4, column=1, pady=(10, 0))
 
+            # Busy indicator while the ATR worker runs
+            progress = ttk.Progressbar(frame, mode="indeterminate")
+            progress.grid(row=5, column=0, columnspan=2, sticky=tk.EW, pady=(10, 0))
+
             # make grid spacing nicer
             for i in range(4):
                 frame.grid_rowconfigure(i, pad=6)
@@ -261,17 +346,146 @@ class ConfigUI:
         except Exception as e:
             messagebox.showerror("Error", f"Unable to open test dialog: {e}")
 
+    def _run_test(self, dlg, progress, side_var, asml_var, sl_var, tp_var):
+        """Run Test: translate the test signal, then compute the ATR on _EXECUTOR.
+
+        The result dialog opens from _drain_test_result_q once the worker is done.
+        """
+        try:
+            side = side_var.get()
+            asml = float(asml_var.get())
+            sl = float(sl_var.get())
+            tp = float(tp_var.get())
+            # Gather current GUI inputs for turbo price / ratio / leverage
+            try:
+                lev = float(self.leverage_var.get())
+            except Exception:
+                lev = self.leverage
+            try:
+                turbo_price = float(self.turbo_entry_var.get())
+            except Exception:
+                turbo_price = self.turbo_entry
+            try:
+                ratio = int(self.ratio_var.get())
+            except Exception:
+                ratio = int(self.ratio)
+
+            TurboTranslator = self._TurboTranslator
+            if TurboTranslator is None:
+                # Lazy import translator to avoid circular deps
+                from turbo.translate import TurboTranslator
+
+            from turbo.translate import financiering_bij_turbo_prijs
+
+            t = TurboTranslator({"leverage": lev})
+            signal = {"side": side, "entry": asml, "sl": sl, "tp": tp}
+            # translate() works from a financing level; the dialog has the turbo
+            # price at the ASML price instead, so derive the level from that
+            financing = financiering_bij_turbo_prijs(asml, turbo_price, ratio, side)
+            res = t.translate(signal, asml_price=asml, financing=financing, ratio=ratio)
+
+            # ATR from the workspace Excel file is computed off the Tk
+            # thread; the result dialog opens from _drain_test_result_q
+            # parameters for buffer: k and min_floor
+            k = self.config_dict.get("atr_buffer_k", 0.30)
+            min_floor = self.config_dict.get("atr_min_buffer", 0.20)
+            ws_path = self._ws_path
+
+            def job():
+                atr_value, suggested_buffer = None, None
+                try:
+                    atr_value, suggested_buffer = _workspace_atr(ws_path, k, min_floor)
+                finally:
+                    self._test_result_q.put({
+                        "dlg": dlg, "progress": progress, "res": res,
+                        "atr": atr_value, "buffer": suggested_buffer, "k": k, "min_floor": min_floor,
+                    })
+
+            _busy(dlg, True)
+            progress.start(10)
+            self._test_pending += 1
+            _EXECUTOR.submit(job)
+            if self._test_pending == 1:
+                self.window.after(80, self._drain_test_result_q)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to run test: {e}", parent=dlg)
+
+    def _drain_test_result_q(self):
+        """Show finished Test Signal results; re-polls while workers are pending."""
+        try:
+            while True:
+                item = self._test_result_q.get_nowait()
+                self._test_pending -= 1
+                dlg = item["dlg"]
+                if not dlg.winfo_exists():
+                    continue  # dialog closed while the worker ran
+                item["progress"].stop()
+                _busy(dlg, False)
+
+                res = item["res"]
+                atr_value = item["atr"]
+                suggested_buffer = item["buffer"]
+                k = item["k"]
+                min_floor = item["min_floor"]
+
+                # Format message with turbo translation and ATR/buffer if available
+                if "error" in res:
+                    msg = f"Turbo: {res['error']}"
+                else:
+                    msg = (
+                        f"Turbo Entry: {res['turbo_entry_price']:.2f}\n"
+                        f"Turbo SL: {res['turbo_sl_price']:.2f}\n"
+                        f"Turbo TP: {res['turbo_tp_price']:.2f}\n"
+                        f"Leverage: {res['leverage']:.2f}\n"
+                        f"Financing: {res.get('financing')}\n"
+                        f"Ratio: {res.get('ratio')}"
+                    )
+
+                if atr_value is not None:
+                    msg += f"\nATR(14) [5-min]: {atr_value:.4f}"
+                if suggested_buffer is not None:
+                    msg += f"\nSuggested SL buffer: {suggested_buffer:.4f} (k={k}, min={min_floor})"
+
+                messagebox.showinfo("Test Result", msg, parent=dlg)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to run test: {e}")
+
+        if self._test_pending > 0:
+            self.window.after(80, self._drain_test_result_q)
+
 
 class StatusWindow:
     """Status window showing "Running..." and live signal log."""
 
-    def __init__(self, config_dict):
-        """Initialize the status window."""
+    # max. queue items handled per _drain() call
+    _MAX_PER_TICK = 50
+    # max. signals waiting for the Tk thread
+    _QUEUE_MAX = 10000
+    # payload keys of add_signal_struct, in tree column order (after "time")
+    _ROW_KEYS = (
+        "setup", "side", "asml_entry", "sl", "tp", "turbo_entry",
+        "turbo_sl", "turbo_tp", "financing", "ratio", "lev",
+    )
+    # columns shown unless "Full columns" is checked
+    _COMPACT_COLS = ("time", "setup", "side", "turbo_entry", "turbo_sl", "turbo_tp")
+
+    def __init__(self, config_dict, parent=None):
+        """Initialize the status window.
+
+        With `parent` (the ConfigUI root) it opens as a Toplevel of that root
+        instead of creating a second tk.Tk().
+        """
         self.config_dict = config_dict
         self.running = True
-        self.signal_queue = queue.Queue()
+        # producer threads append, the Tk thread pops (both thread-safe on a
+        # deque); maxlen drops the oldest items if the GUI cannot keep up
+        self.signal_queue = collections.deque(maxlen=self._QUEUE_MAX)
+        # Signal Log keeps at most this many rows (oldest are dropped)
+        self.max_rows = int(config_dict.get("ui_max_rows", 2000))
 
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(parent) if parent is not None else tk.Tk()
         self.window.title("ASML Trading App - Monitor")
         self.window.geometry("700x500")
         self.window.protocol("WM_DELETE_WINDOW", self.on_close)
@@ -332,6 +546,11 @@ class StatusWindow:
             else:
                 self.tree.column(c, width=100, anchor=tk.E)
 
+        # Compact view by default: fewer cells to redraw per insert/scroll;
+        # the "Full columns" checkbox shows all columns again
+        self._all_cols = cols
+        self.tree.configure(displaycolumns=self._COMPACT_COLS)
+
         vsb = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscroll=vsb.set)
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -344,62 +563,101 @@ class StatusWindow:
         self.stop_btn = ttk.Button(button_frame, text="Stop Monitor", command=self.on_stop)
         self.stop_btn.pack(side=tk.RIGHT, padx=5)
 
-        # Start polling for signals
-        self.poll_queue()
+        self.full_cols_var = tk.BooleanVar(value=False)
+        full_cols_chk = ttk.Checkbutton(button_frame, text="Full columns", variable=self.full_cols_var,
+                                        command=self.on_toggle_columns)
+        full_cols_chk.pack(side=tk.LEFT, padx=5)
+
+        # Signals are pushed via <<Signal>>; items queued before mainloop()
+        # (their event could not be delivered) are drained once it is idle
+        self.window.bind("<<Signal>>", self._on_signal)
+        self.window.after_idle(self._on_signal)
 
     def add_signal(self, message):
         """Add a textual signal message to the queue (backcompat).
 
         Prefer `add_signal_struct` for structured data.
         """
-        self.signal_queue.put({"_message": str(message)})
+        self.signal_queue.append({"_message": str(message)})
+        self._notify()
 
     def add_signal_struct(self, data: dict):
         """Add structured signal data (dict) to the queue.
 
         Expected keys: setup, side, asml_entry, sl, tp, turbo_entry, turbo_sl, turbo_tp, financing, ratio, lev
         """
-        self.signal_queue.put(data)
+        self.signal_queue.append(data)
+        self._notify()
+
+    def _notify(self):
+        """Wake the Tk thread with a <<Signal>> event (callable from any thread).
 
-    def poll_queue(self):
-        """Poll the signal queue and update the log."""
+        Before mainloop() runs (or after the window is gone) the event cannot
+        be delivered; the after_idle() drain from build_ui() picks up what
+        was queued before the loop started.
+        """
         try:
-            while True:
-                item = self.signal_queue.get_nowait()
-                # If it's a dict with structured fields, insert into tree
+            self.window.event_generate("<<Signal>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass
+
+    def _on_signal(self, event=None):
+        """<<Signal>> handler: drain the queue right away."""
+        if self._drain():
+            self.window.after(0, self._on_signal)
+
+    def _drain(self):
+        """Move queued signals into the log; True if items are left over.
+
+        Drains at most _MAX_PER_TICK items per call so a burst cannot block
+        the event loop; the rows are built first and then inserted in one
+        tight loop.
+        """
+        rows = []
+        append = rows.append
+        ts = time.strftime("%H:%M:%S")
+        row_struct, row_message, row_raw = self._row_struct, self._row_message, self._row_raw
+        popleft = self.signal_queue.popleft
+        try:
+            for _ in range(self._MAX_PER_TICK):
+                item = popleft()
+                # payload or message dicts; anything else is shown as text
                 if isinstance(item, dict):
-                    if "_message" in item:
-                        import time as _time
-                        ts = _time.strftime("%H:%M:%S")
-                        self.tree.insert("", "end", values=(ts, item.get("_message"), "", "", "", "", "", "", "", "", "", ""))
-                    else:
-                        import time as _time
-                        ts = _time.strftime("%H:%M:%S")
-                        vals = (
-                            ts,
-                            item.get("setup", ""),
-                            item.get("side", ""),
-                            f"{item.get('asml_entry', '')}",
-                            f"{item.get('sl', '')}",
-                            f"{item.get('tp', '')}",
-                            f"{item.get('turbo_entry', '')}",
-                            f"{item.get('turbo_sl', '')}",
-                            f"{item.get('turbo_tp', '')}",
-                            f"{item.get('financing', '')}",
-                            f"{item.get('ratio', '')}",
-                            f"{item.get('lev', '')}",
-                        )
-                        self.tree.insert("", "end", values=vals)
+                    append((row_message if "_message" in item else row_struct)(item, ts))
                 else:
-                    import time as _time
-                    ts = _time.strftime("%H:%M:%S")
-                    self.tree.insert("", "end", values=(ts, str(item), "", "", "", "", "", "", "", "", "", ""))
-        except queue.Empty:
+                    append(row_raw(item, ts))
+        except IndexError:
             pass
 
-        # Re-schedule this method
-        if self.running:
-            self.window.after(100, self.poll_queue)
+        insert = self.tree.insert
+        for row in rows:
+            insert("", "end", values=row)
+        if rows:
+            kids = self.tree.get_children("")
+            excess = len(kids) - self.max_rows
+            if excess > 0:
+                self.tree.delete(*kids[:excess])
+        return bool(self.signal_queue)
+
+    # Row builders for _drain(): item + timestamp -> Treeview values
+    _BLANK = ("",) * 10
+
+    @classmethod
+    def _row_struct(cls, item, ts):
+        g = item.get
+        return (ts, *("" if (v := g(k)) is None else v for k in cls._ROW_KEYS))
+
+    @classmethod
+    def _row_message(cls, item, ts):
+        return (ts, item.get("_message"), *cls._BLANK)
+
+    @classmethod
+    def _row_raw(cls, item, ts):
+        return (ts, str(item), *cls._BLANK)
+
+    def on_toggle_columns(self):
+        """Switch the Signal Log between the compact and the full column set."""
+        self.tree.configure(displaycolumns=self._all_cols if self.full_cols_var.get() else self._COMPACT_COLS)
 
     def on_stop(self):
         """Stop monitoring."""
@@ -0,0 +1,69 @@
+"""TradingView lightweight-charts als Streamlit-component.
+
+Alternatief voor de Plotly-chart (config: `chart_engine: lightweight`).
+De browser houdt de chart zelf bij: de eerste render stuurt de volledige
+historie (setData), daarna stuurt Python per rerun alleen de candles vanaf
+de laatst verstuurde (series.update). Welke candle dat was staat per key
+in st.session_state. Entry/SL/TP zijn price lines die met applyOptions
+worden verplaatst i.p.v. opnieuw getekend.
+
+Is de iframe opnieuw opgebouwd (lege chart) en komt er toch een update,
+dan geeft de component een nieuwe waarde terug; de volgende render is dan
+weer volledig.
+
+De component laadt lightweight-charts vanaf unpkg; zonder internet blijft
+de chart leeg en is de Plotly-chart de aangewezen keuze.
+"""
+
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_component = components.declare_component(
+    "lw_chart", path=os.path.dirname(os.path.abspath(__file__)))
+
+
+def lw_chart(candles, entry_val, sl_val, tp_val, signals=(), series_id="",
+             run_id=None, turbo_sl=None, turbo_tp=None, height=430, key=None):
+    """Render de candles met niveaulijnen en signaalmarkers.
+
+    `series_id` identificeert de reeks (bijv. ticker + feed) en `run_id`
+    de run van de engine; wijkt een van beide af van de vorige render, dan
+    wordt de volledige historie opnieuw gestuurd i.p.v. alleen de nieuwe
+    candles. Zonder `key` gaat elke render volledig.
+    """
+    first = candles[0]["time"] if candles else None
+    last = candles[-1]["time"] if candles else None
+    sent_key = f"_lw_chart_sent:{key}"
+    sent = st.session_state.get(sent_key) if key is not None else None
+    reply = st.session_state.get(key) if key is not None else None
+    # ook volledig als de laatst verstuurde candle uit het venster is
+    # geschoven of de reeks terugloopt (series.update() weigert oudere bars)
+    full = (sent is None or sent[:2] != (series_id, run_id) or reply != sent[3]
+            or first is None or first > sent[2] or last < sent[2])
+    if full:
+        new = candles
+    else:
+        # alleen de candles vanaf de laatst verstuurde (die kan nog lopen)
+        i = len(candles)
+        while i > 0 and candles[i - 1]["time"] >= sent[2]:
+            i -= 1
+        new = candles[i:]
+    if key is not None and candles:
+        st.session_state[sent_key] = (series_id, run_id, last, reply)
+
+    bars = [(c["time"], c["open"], c["high"], c["low"], c["close"]) for c in new]
+    markers = [
+        (s["time"], s.get("side"), s.get("meta", {}).get("setup_name", ""))
+        for s in signals[-10:] if first is not None and str(s.get("time", "")) >= first
+    ]
+    sl_title = "SL" if turbo_sl is None else f"SL · T {turbo_sl:.2f}"
+    tp_title = "TP" if turbo_tp is None else f"TP · T {turbo_tp:.2f}"
+    levels = {
+        "entry": {"price": entry_val, "color": "#4fa3e0", "title": "Entry", "dashed": False},
+        "sl": {"price": sl_val, "color": "#ef5350", "title": sl_title, "dashed": True},
+        "tp": {"price": tp_val, "color": "#26a69a", "title": tp_title, "dashed": True},
+    }
+    return _component(bars=bars, full=full, levels=levels, markers=markers,
+                      height=height, key=key, default=None)
@@ -1,3 +1,19 @@
+# Signal line templates, one per turbo variant and with/without leverage,
+# so print_signal() formats the whole line in a single call
+_FMT_BASE = "[{setup}] [{side}] Entry: {entry}, SL: {sl}, TP: {tp} | "
+_FMT_TURBO = {
+    "full": "Turbo Entry: {te:.2f}, SL: {tsl:.2f}, TP: {ttp:.2f}",
+    "prices": "Turbo SL Price: {tsl:.2f}, TP Price: {ttp:.2f}",
+    "distances": "Turbo SL: {tsl}, TP: {ttp}",
+}
+_FMT_LEV = " | Turbo lev: {lev:.2f}"
+_TEMPLATES = {
+    (kind, with_lev): _FMT_BASE + turbo + (_FMT_LEV if with_lev else "")
+    for kind, turbo in _FMT_TURBO.items()
+    for with_lev in (False, True)
+}
+
+
 class Notifier:
     def __init__(self, status_window=None):
         """Initialize notifier with optional GUI status window."""
@@ -27,28 +43,27 @@ class Notifier:
             turbo_sl_price = turbo_vals.get("turbo_sl_price")
             turbo_tp_price = turbo_vals.get("turbo_tp_price")
 
-        # Print in requested format with setup name
-        base = f"[{setup_name}] [{side}] Entry: {entry}, SL: {sl}, TP: {tp}"
-        turbo_part = f"Turbo SL: {turbo_sl}, TP: {turbo_tp}"
-        # If absolute turbo prices available, show them instead (accept either field name)
+        # Print in requested format with setup name; absolute turbo prices
+        # (if available) are shown instead of the legacy distances
+        kind = "distances"
+        te = None
         if turbo_sl_price is not None and turbo_tp_price is not None:
             # turbo_entry_price may be None if translator used 'turbo_price' key
-            entry_display = turbo_entry_price if turbo_entry_price is not None else turbo_vals.get("turbo_price")
-            if entry_display is not None:
-                turbo_part = (
-                    f"Turbo Entry: {entry_display:.2f}, SL: {turbo_sl_price:.2f}, TP: {turbo_tp_price:.2f}"
-                )
-            else:
-                turbo_part = f"Turbo SL Price: {turbo_sl_price:.2f}, TP Price: {turbo_tp_price:.2f}"
-        msg = f"{base} | {turbo_part}"
-        if lev:
-            msg += f" | Turbo lev: {lev:.2f}"
-        
+            te = turbo_entry_price if turbo_entry_price is not None else turbo_vals.get("turbo_price")
+            kind = "full" if te is not None else "prices"
+            turbo_sl, turbo_tp = turbo_sl_price, turbo_tp_price
+        msg = _TEMPLATES[kind, bool(lev)].format(
+            setup=setup_name, side=side, entry=entry, sl=sl, tp=tp,
+            te=te, tsl=turbo_sl, ttp=turbo_tp, lev=lev,
+        )
+
         # Print to terminal
         print(msg)
         
-        # Also send structured data to GUI if available
-        if self.status_window:
+        # Also send structured data to GUI if available (headless callers
+        # skip the payload entirely)
+        status_window = self.status_window
+        if status_window is not None:
             payload = {
                 "setup": setup_name,
                 "side": side,
@@ -60,10 +75,10 @@ class Notifier:
                 "turbo_tp": turbo_tp_price,
                 "financing": turbo_vals.get("financing") if turbo_vals else None,
                 "ratio": turbo_vals.get("ratio") if turbo_vals else None,
-                "lev": turbo_vals.get("leverage") if turbo_vals else None,
+                "lev": lev,
             }
             try:
-                self.status_window.add_signal_struct(payload)
+                status_window.add_signal_struct(payload)
             except Exception:
                 # fallback to plain string when structured insertion fails
-                self.status_window.add_signal(msg)
+                status_window.add_signal(msg)